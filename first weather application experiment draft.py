@@ -44,16 +44,33 @@ Main features:
 
 Requires:
     pip install requests
+Optional:
+    pip install orjson   (faster JSON parsing)
 """
 
 import tkinter as tk
 from tkinter import messagebox
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import bisect
+import functools
+import heapq
 import math
 import os
 import json
+import queue
+import threading
+
+try:
+    import orjson  # optional, parses the large forecast payloads much faster
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # ===========================
 # PATHS & SETTINGS FILE
@@ -65,6 +82,7 @@ else:
     BASE_DIR = os.getcwd()
 
 SETTINGS_FILE = os.path.join(BASE_DIR, "weather_settings.json")
+FORECAST_CACHE_FILE = os.path.join(BASE_DIR, "forecast_cache.json")
 
 # ===========================
 # API ENDPOINTS
@@ -121,10 +139,30 @@ last_air: Optional[Dict[str, Any]] = None
 daily_dates: List[str] = []
 selected_day_index: int = 0
 favourites: List[Dict[str, Any]] = []
+favourite_keys: set = set()  # format_location() of every favourite, for O(1) duplicate checks
 best_hour_time: Optional[str] = None  # ISO "YYYY-MM-DDTHH:MM"
 
-# Forecast cache (NEW): 20 minute cache
-forecast_cache: Dict[Tuple[float, float, str], Dict[str, Any]] = {}
+# Derived data for the forecast on screen: unit-independent arrays
+# (forecast_view) and unit-converted series (display_arrays). Kept out of
+# the forecast dict so cached/persisted payloads stay raw.
+_view: Dict[str, Any] = {}
+_display: Dict[str, Any] = {}
+
+# Forecast cache (NEW): 20 minute cache, persisted to FORECAST_CACHE_FILE.
+# Kept in least-recently-used order and capped at FORECAST_CACHE_MAX entries.
+FORECAST_CACHE_TTL = timedelta(minutes=20)
+FORECAST_CACHE_MAX = 32
+forecast_cache: "OrderedDict[Tuple[float, float, str, str], Dict[str, Any]]" = OrderedDict()
+_forecast_cache_lock = threading.Lock()
+_forecast_cache_timer: Optional[threading.Timer] = None
+# Held while the cache file is written, so the debounce timer and the exit
+# save never write the temp file at the same time.
+_forecast_cache_write_lock = threading.Lock()
+
+# Settings writes are debounced on the Tk loop so bursts of toggles share one write.
+SETTINGS_SAVE_DELAY_MS = 500
+_settings_save_id: Optional[str] = None
+_settings_written: Optional[str] = None  # last JSON text written, to skip identical saves
 
 # Widgets
 root: tk.Tk
@@ -136,6 +174,11 @@ settings_button: tk.Button
 last_updated_label: tk.Label
 top_frame: tk.Frame
 autocomplete_listbox: tk.Listbox
+# Plain labels/buttons of the top bar and sidebar, gathered at GUI setup so
+# apply_theme() needn't walk winfo_children() (get_button uses the accent).
+top_labels: List[tk.Label] = []
+top_buttons: List[tk.Button] = []
+favourites_labels: List[tk.Label] = []
 
 favourites_listbox: tk.Listbox
 
@@ -164,7 +207,8 @@ ten_day_overview_text: tk.Text
 hourly_frame: tk.LabelFrame
 day_selector_frame: tk.Frame
 day_label: tk.Label
-day_buttons: List[tk.Button] = []
+day_buttons: List[tk.Button] = []  # packed prefix of _day_button_pool
+_day_button_pool: List[tk.Button] = []
 
 hourly_strip_canvas: tk.Canvas
 hourly_strip_scrollbar: tk.Scrollbar
@@ -243,66 +287,122 @@ def mph_to_kmh(mph: Optional[float]) -> Optional[float]:
     return mph / 0.621371
 
 
-def fmt_temp_value(c: Optional[float]) -> str:
+# Formatters/converters come in metric and imperial flavours;
+# set_units_mode() binds the public names (fmt_temp_value, temp_unit, ...)
+# to one set, so hot label loops don't re-check units_mode on every call.
+
+def _fmt_temp_metric(c: Optional[float]) -> str:
     if c is None:
         return "N/A"
-    if units_mode == "metric":
-        return f"{c:.1f} °C"
-    else:
-        f = c_to_f(c)
-        return f"{f:.1f} °F"
+    return f"{c:.1f} °C"
+
 
+def _fmt_temp_imperial(c: Optional[float]) -> str:
+    if c is None:
+        return "N/A"
+    return f"{c * 9.0 / 5.0 + 32.0:.1f} °F"
 
-def fmt_rain_value(mm: Optional[float]) -> str:
+
+def _fmt_rain_metric(mm: Optional[float]) -> str:
     if mm is None:
         return "N/A"
-    if units_mode == "metric":
-        return f"{mm:.1f} mm"
-    else:
-        inch = mm_to_in(mm)
-        return f"{inch:.2f} in"
+    return f"{mm:.1f} mm"
 
 
-def fmt_wind_value(kmh: Optional[float]) -> str:
+def _fmt_rain_imperial(mm: Optional[float]) -> str:
+    if mm is None:
+        return "N/A"
+    return f"{mm / 25.4:.2f} in"
+
+
+def _fmt_wind_metric(kmh: Optional[float]) -> str:
     if kmh is None:
         return "N/A"
-    if units_mode == "metric":
-        return f"{kmh:.1f} km/h"
-    else:
-        mph = kmh_to_mph(kmh)
-        return f"{mph:.1f} mph"
+    return f"{kmh:.1f} km/h"
 
 
-def temp_axis_label(c: float) -> str:
-    if units_mode == "metric":
-        return f"{c:.0f}°C"
-    else:
-        f = c_to_f(c)
-        return f"{f:.0f}°F"
+def _fmt_wind_imperial(kmh: Optional[float]) -> str:
+    if kmh is None:
+        return "N/A"
+    return f"{kmh * 0.621371:.1f} mph"
 
 
-def temp_point_label(c: float) -> str:
-    if units_mode == "metric":
-        return f"{c:.1f}°C"
-    else:
-        f = c_to_f(c)
-        return f"{f:.1f}°F"
+def _identity(v: Optional[float]) -> Optional[float]:
+    return v
 
 
-def wind_axis_label(kmh: float) -> str:
-    if units_mode == "metric":
-        return f"{kmh:.0f} km/h"
-    else:
-        mph = kmh_to_mph(kmh)
-        return f"{mph:.0f} mph"
+def _temp_unit_metric() -> str:
+    return "°C"
+
+
+def _temp_unit_imperial() -> str:
+    return "°F"
+
+
+def _wind_unit_metric() -> str:
+    return "km/h"
+
+
+def _wind_unit_imperial() -> str:
+    return "mph"
 
 
-def wind_point_label(kmh: float) -> str:
-    if units_mode == "metric":
-        return f"{kmh:.1f} km/h"
+def set_units_mode(mode: str) -> None:
+    global units_mode, fmt_temp_value, fmt_rain_value, fmt_wind_value
+    global temp_unit, wind_unit, to_display_temp, to_display_wind
+    units_mode = mode
+    if mode == "metric":
+        fmt_temp_value = _fmt_temp_metric
+        fmt_rain_value = _fmt_rain_metric
+        fmt_wind_value = _fmt_wind_metric
+        temp_unit = _temp_unit_metric
+        wind_unit = _wind_unit_metric
+        to_display_temp = _identity
+        to_display_wind = _identity
     else:
-        mph = kmh_to_mph(kmh)
-        return f"{mph:.1f} mph"
+        fmt_temp_value = _fmt_temp_imperial
+        fmt_rain_value = _fmt_rain_imperial
+        fmt_wind_value = _fmt_wind_imperial
+        temp_unit = _temp_unit_imperial
+        wind_unit = _wind_unit_imperial
+        to_display_temp = c_to_f
+        to_display_wind = kmh_to_mph
+    for label_fn in (temp_axis_label, temp_point_label, wind_axis_label, wind_point_label):
+        label_fn.cache_clear()
+
+
+# Graph/label helpers below take values already in display units
+# (see display_arrays), so they only format. The chart labels are memoized
+# per value (neighbouring hours often repeat a reading); set_units_mode()
+# clears them since the unit suffix is baked in.
+
+def fmt_display_temp(v: Optional[float]) -> str:
+    if v is None:
+        return "N/A"
+    return f"{v:.1f} {temp_unit()}"
+
+
+@functools.lru_cache(maxsize=4096)
+def temp_axis_label(v: float) -> str:
+    return f"{v:.0f}{temp_unit()}"
+
+
+@functools.lru_cache(maxsize=4096)
+def temp_point_label(v: float) -> str:
+    return f"{v:.1f}{temp_unit()}"
+
+
+@functools.lru_cache(maxsize=4096)
+def wind_axis_label(v: float) -> str:
+    return f"{v:.0f} {wind_unit()}"
+
+
+@functools.lru_cache(maxsize=4096)
+def wind_point_label(v: float) -> str:
+    return f"{v:.1f} {wind_unit()}"
+
+
+set_units_mode(units_mode)
 
 
 # ===========================
@@ -341,15 +441,17 @@ WEATHER_DESC = {
 }
 
 
+# weather_text and the UV/AQI interpreters are pure and called per hour, day
+# and compare row, so they are memoised. typed=True keeps 4 and 4.0 apart
+# ("Weather code 4.0").
+@functools.lru_cache(maxsize=64, typed=True)
 def weather_text(code: Optional[int]) -> str:
     if code is None:
         return "Unknown"
     return WEATHER_DESC.get(code, f"Weather code {code}")
 
 
-def weather_icon(code: Optional[int]) -> str:
-    if code is None:
-        return "🌡️"
+def _icon_for(code: int) -> str:
     if code == 0:
         return "☀️"
     if code in (1, 2):
@@ -373,10 +475,22 @@ def weather_icon(code: Optional[int]) -> str:
     return "🌡️"
 
 
+# Weather codes are a small fixed enum, so the range ladder is evaluated once.
+WEATHER_ICON: Dict[int, str] = {c: _icon_for(c) for c in range(100)}
+
+
+def weather_icon(code: Optional[int]) -> str:
+    if code is None:
+        return "🌡️"
+    icon = WEATHER_ICON.get(code)
+    return icon if icon is not None else _icon_for(code)
+
+
 # ===========================
 # UV, AQI & SUGGESTIONS
 # ===========================
 
+@functools.lru_cache(maxsize=64, typed=True)
 def interpret_uv(uv: Optional[float]) -> str:
     if uv is None:
         return "N/A"
@@ -391,6 +505,7 @@ def interpret_uv(uv: Optional[float]) -> str:
     return "Extreme"
 
 
+@functools.lru_cache(maxsize=64, typed=True)
 def interpret_aqi_eu(value: Optional[float]) -> str:
     if value is None:
         return "N/A"
@@ -407,6 +522,7 @@ def interpret_aqi_eu(value: Optional[float]) -> str:
     return "Extremely poor"
 
 
+@functools.lru_cache(maxsize=64, typed=True)
 def interpret_aqi_us(value: Optional[float]) -> str:
     if value is None:
         return "N/A"
@@ -561,6 +677,56 @@ def compute_comfort_index(
     if temp_c is None:
         return None
 
+    return _comfort_score(temp_c, hum, wind_kmh, uv, rain_prob)
+
+
+def compute_comfort_series(
+    temps: List[Any],
+    hums: List[Any],
+    winds: List[Any],
+    uvs: List[Any],
+    rain_probs: List[Any],
+) -> List[Optional[float]]:
+    """
+    compute_comfort_index over whole hourly lists in one pass.
+    The units branch is decided once for the list instead of once per hour.
+    """
+    imperial = units_mode == "imperial"
+    num = (int, float)
+    out: List[Optional[float]] = []
+    for temp, hum, wind, uv, rain_p in zip(temps, hums, winds, uvs, rain_probs):
+        if not isinstance(temp, num):
+            out.append(None)
+            continue
+        wind_v = float(wind) if isinstance(wind, num) else None
+        if imperial:
+            temp_c = f_to_c(float(temp))
+            if wind_v is not None:
+                wind_v = mph_to_kmh(wind_v)
+        else:
+            temp_c = float(temp)
+        out.append(_comfort_score(
+            temp_c,
+            float(hum) if isinstance(hum, num) else None,
+            wind_v,
+            float(uv) if isinstance(uv, num) else None,
+            float(rain_p) if isinstance(rain_p, num) else None,
+        ))
+    return out
+
+
+# Metric-only and pure, so units toggles can't stale it. Open-Meteo values
+# repeat a lot (one decimal, integer percentages) within a fetch and across
+# refreshes, so most hours are a cache hit.
+@functools.lru_cache(maxsize=4096)
+def _comfort_score(
+    temp_c: float,
+    hum: Optional[float],
+    wind_kmh: Optional[float],
+    uv: Optional[float],
+    rain_prob: Optional[float],
+) -> float:
+    """Shared scoring for compute_comfort_index/_series (metric inputs)."""
     score = 100.0
     ideal = 19.0
     score -= min(60.0, abs(temp_c - ideal) * 2.5)
@@ -604,96 +770,139 @@ def compute_comfort_index(
 # API HELPERS
 # ===========================
 
+# Shared HTTP session: keep-alive + connection pooling for the three
+# Open-Meteo hosts (forecast, air quality, geocoding).
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "UltimateWeatherBuddy/1.0"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# Worker pool for network fetches (I/O bound, so threads are fine).
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Network errors raised on worker threads wait here until the Tk thread shows them.
+_network_errors: "queue.Queue[str]" = queue.Queue()
+
+
+def show_network_error(message: str) -> None:
+    if threading.current_thread() is threading.main_thread():
+        messagebox.showerror("Network error", message)
+    else:
+        _network_errors.put(message)
+
+
+def flush_network_errors() -> None:
+    """Show errors queued by worker threads. Tk thread only."""
+    messages: List[str] = []
+    while True:
+        try:
+            msg = _network_errors.get_nowait()
+        except queue.Empty:
+            break
+        if msg not in messages:
+            messages.append(msg)
+    if messages:
+        messagebox.showerror("Network error", "\n\n".join(messages))
+
+
 def http_get_json(url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     try:
-        r = requests.get(url, params=params, timeout=10)
+        r = SESSION.get(url, params=params, timeout=10)
         r.raise_for_status()
-        return r.json()
+        return _loads(r.content)
     except requests.exceptions.RequestException as e:
-        messagebox.showerror("Network error", f"Could not reach the service:\n{e}")
+        show_network_error(f"Could not reach the service:\n{e}")
+        return None
+    except ValueError as e:
+        show_network_error(f"The service sent an invalid response:\n{e}")
         return None
 
 
-def geocode_city(name: str) -> Optional[Dict[str, Any]]:
+def geocode_search(name: str) -> Optional[List[Dict[str, Any]]]:
+    """Raw geocoding matches for a name (None on network error). Worker-thread safe."""
     params = {"name": name, "count": 5, "language": "en", "format": "json"}
     data = http_get_json(GEOCODE_URL, params)
     if not data:
         return None
-    results = data.get("results") or []
+    return data.get("results") or []
+
+
+def geocode_city(name: str, results: List[Dict[str, Any]],
+                 on_found: Callable[[Optional[Dict[str, Any]]], None]) -> None:
+    """
+    Pick one location from geocode_search results and pass it to on_found
+    (None if nothing matched or the user cancelled). Asks the user if
+    ambiguous, without blocking the event loop.
+    """
     if not results:
         messagebox.showerror("Not found", f"Could not find any place called '{name}'.")
-        return None
+        on_found(None)
+        return
+
+    def picked(r: Optional[Dict[str, Any]]) -> None:
+        if r is None:
+            on_found(None)
+            return
+        on_found({
+            "name": r.get("name") or name,
+            "country": r.get("country") or "",
+            "admin1": r.get("admin1") or "",
+            "latitude": r.get("latitude"),
+            "longitude": r.get("longitude"),
+            "timezone": r.get("timezone") or "auto",
+        })
 
     if len(results) == 1:
-        r = results[0]
+        picked(results[0])
     else:
-        r = choose_location(results)
-        if r is None:
-            return None
-
-    return {
-        "name": r.get("name") or name,
-        "country": r.get("country") or "",
-        "admin1": r.get("admin1") or "",
-        "latitude": r.get("latitude"),
-        "longitude": r.get("longitude"),
-        "timezone": r.get("timezone") or "auto",
-    }
+        choose_location(results, picked)
 
 
-def choose_location(results: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def choose_location(results: List[Dict[str, Any]],
+                    on_selected: Callable[[Optional[Dict[str, Any]]], None]) -> None:
+    """Non-blocking chooser: on_selected gets the picked result, or None on cancel/close."""
     dialog = tk.Toplevel(root)
     dialog.title("Choose a location")
     dialog.grab_set()
 
     tk.Label(dialog, text="Multiple matches found. Choose one:").pack(padx=10, pady=5)
     lb = tk.Listbox(dialog, width=60, height=min(8, len(results)))
-    for r in results:
-        name = r.get("name") or ""
-        admin1 = r.get("admin1") or ""
-        country = r.get("country") or ""
-        parts = [name]
-        if admin1:
-            parts.append(admin1)
-        if country:
-            parts.append(country)
-        lb.insert(tk.END, ", ".join(parts))
+    lb.insert(tk.END, *[format_location(r) for r in results])
     lb.pack(padx=10, pady=5)
 
-    chosen = {"i": None}
+    def close(r: Optional[Dict[str, Any]]) -> None:
+        dialog.destroy()
+        on_selected(r)
 
     def on_ok(event=None):
         sel = lb.curselection()
         if not sel:
             return
-        chosen["i"] = sel[0]
-        dialog.destroy()
+        close(results[sel[0]])
 
     def on_cancel():
-        dialog.destroy()
+        close(None)
 
     lb.bind("<Double-Button-1>", on_ok)
     dialog.bind("<Return>", on_ok)
     dialog.bind("<Escape>", lambda e: on_cancel())
+    dialog.protocol("WM_DELETE_WINDOW", on_cancel)
 
     btn_frame = tk.Frame(dialog)
     btn_frame.pack(pady=5)
     tk.Button(btn_frame, text="OK", command=on_ok).pack(side="left", padx=5)
     tk.Button(btn_frame, text="Cancel", command=on_cancel).pack(side="left", padx=5)
 
-    root.wait_window(dialog)
-    i = chosen["i"]
-    if i is None:
-        return None
-    return results[i]
-
 
-def fetch_weather(lat: float, lon: float, timezone: str) -> Optional[Dict[str, Any]]:
-    params = {
-        "latitude": lat,
-        "longitude": lon,
-        "timezone": timezone or "auto",
-        "current": ",".join([
+# Fields requested per use. "full" feeds the main view; "compare" only shows
+# today's high/low, rain chance, wind and UV, so it skips the hourly block
+# and asks for a single day.
+FORECAST_PROFILES: Dict[str, Dict[str, Any]] = {
+    "full": {
+        "current": [
             "temperature_2m",
             "relative_humidity_2m",
             "apparent_temperature",
@@ -704,8 +913,8 @@ def fetch_weather(lat: float, lon: float, timezone: str) -> Optional[Dict[str, A
             "wind_direction_10m",
             "pressure_msl",
             "is_day",
-        ]),
-        "hourly": ",".join([
+        ],
+        "hourly": [
             "temperature_2m",
             "apparent_temperature",
             "relative_humidity_2m",
@@ -713,8 +922,8 @@ def fetch_weather(lat: float, lon: float, timezone: str) -> Optional[Dict[str, A
             "uv_index",
             "wind_speed_10m",
             "weather_code",
-        ]),
-        "daily": ",".join([
+        ],
+        "daily": [
             "weather_code",
             "temperature_2m_max",
             "temperature_2m_min",
@@ -726,27 +935,117 @@ def fetch_weather(lat: float, lon: float, timezone: str) -> Optional[Dict[str, A
             "wind_speed_10m_max",
             "sunrise",
             "sunset",
-        ]),
+        ],
         "forecast_days": FORECAST_DAYS,
+    },
+    "compare": {
+        "daily": [
+            "temperature_2m_max",
+            "temperature_2m_min",
+            "precipitation_probability_max",
+            "wind_speed_10m_max",
+            "uv_index_max",
+        ],
+        "forecast_days": 1,
+    },
+}
+
+
+def fetch_weather(lat: float, lon: float, timezone: str, profile: str = "full") -> Optional[Dict[str, Any]]:
+    fields = FORECAST_PROFILES[profile]
+    params: Dict[str, Any] = {
+        "latitude": lat,
+        "longitude": lon,
+        "timezone": timezone or "auto",
+        "forecast_days": fields["forecast_days"],
     }
+    for block in ("current", "hourly", "daily"):
+        if block in fields:
+            params[block] = ",".join(fields[block])
     return http_get_json(WEATHER_URL, params)
 
 
-def fetch_weather_cached(lat: float, lon: float, timezone: str) -> Optional[Dict[str, Any]]:
-    """NEW: 20-minute cache for forecasts."""
-    key = (round(lat, 3), round(lon, 3), units_mode)
-    item = forecast_cache.get(key)
-    if item:
-        age = datetime.now() - item["time"]
-        if age < timedelta(minutes=20):
-            return item["data"]
+def fetch_weather_cached(lat: float, lon: float, timezone: str, profile: str = "full") -> Optional[Dict[str, Any]]:
+    """NEW: 20-minute cache for forecasts. A fresh "full" entry also answers slimmer profiles."""
+    base = (round(lat, 3), round(lon, 3), units_mode)
+    key = base + (profile,)
+    lookups = [key] if profile == "full" else [key, base + ("full",)]
+    with _forecast_cache_lock:
+        for k in lookups:
+            item = forecast_cache.get(k)
+            if item and datetime.now() - item["time"] < FORECAST_CACHE_TTL:
+                forecast_cache.move_to_end(k)
+                return item["data"]
 
-    data = fetch_weather(lat, lon, timezone)
+    data = fetch_weather(lat, lon, timezone, profile)
     if data:
-        forecast_cache[key] = {"time": datetime.now(), "data": data}
+        with _forecast_cache_lock:
+            forecast_cache[key] = {"time": datetime.now(), "data": data}
+            forecast_cache.move_to_end(key)
+            while len(forecast_cache) > FORECAST_CACHE_MAX:
+                forecast_cache.popitem(last=False)
+        schedule_forecast_cache_save()
     return data
 
 
+def load_forecast_cache() -> None:
+    """Restore still-fresh forecasts saved by a previous run."""
+    try:
+        with open(FORECAST_CACHE_FILE, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return
+    if not isinstance(entries, list):
+        return
+
+    now = datetime.now()
+    for entry in entries:
+        try:
+            lat, lon, units, *rest = entry["key"]
+            stamp = datetime.fromisoformat(entry["time"])
+            data = entry["data"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        profile = rest[0] if rest else "full"  # older files had no profile
+        if isinstance(data, dict) and now - stamp < FORECAST_CACHE_TTL and profile in FORECAST_PROFILES:
+            forecast_cache[(lat, lon, units, profile)] = {"time": stamp, "data": data}
+    # Saved oldest-first, so trimming from the front keeps the most recent.
+    while len(forecast_cache) > FORECAST_CACHE_MAX:
+        forecast_cache.popitem(last=False)
+
+
+def save_forecast_cache() -> None:
+    """Write the cache file via a temp file and os.replace, so a reader never sees it half-written."""
+    with _forecast_cache_lock:
+        entries = [
+            {"key": list(key), "time": item["time"].isoformat(), "data": item["data"]}
+            for key, item in forecast_cache.items()
+        ]
+    tmp_path = FORECAST_CACHE_FILE + ".tmp"
+    with _forecast_cache_write_lock:
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, FORECAST_CACHE_FILE)
+        except OSError:
+            pass
+
+
+def schedule_forecast_cache_save() -> None:
+    """
+    Debounced save: bursts of fetches (e.g. Compare) share one write.
+    Uses a threading.Timer rather than root.after because fetches run on
+    worker threads.
+    """
+    global _forecast_cache_timer
+    with _forecast_cache_lock:
+        if _forecast_cache_timer is not None:
+            _forecast_cache_timer.cancel()
+        _forecast_cache_timer = threading.Timer(2.0, save_forecast_cache)
+        _forecast_cache_timer.daemon = True
+        _forecast_cache_timer.start()
+
+
 def fetch_air_quality(lat: float, lon: float, timezone: str) -> Optional[Dict[str, Any]]:
     params = {
         "latitude": lat,
@@ -760,25 +1059,151 @@ def fetch_air_quality(lat: float, lon: float, timezone: str) -> Optional[Dict[st
     return data.get("current")
 
 
+def fetch_forecast_and_air(loc: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Fetch forecast and air quality for a location concurrently."""
+    lat, lon, tz = loc["latitude"], loc["longitude"], loc["timezone"]
+    weather_future = EXECUTOR.submit(fetch_weather_cached, lat, lon, tz)
+    air_future = EXECUTOR.submit(fetch_air_quality, lat, lon, tz)
+    return weather_future.result(), air_future.result()
+
+
+# ===========================
+# BACKGROUND WORK
+# ===========================
+
+POLL_MS = 50
+
+
+def run_in_background(work, on_done) -> None:
+    """
+    Run work() on a daemon thread, then call on_done(result) on the Tk thread.
+    Tk is not thread-safe, so the worker never touches widgets; the Tk thread
+    polls for completion with root.after. on_done gets None if work() raised.
+    """
+    done = threading.Event()
+    result: List[Any] = [None]
+
+    def _bg():
+        try:
+            result[0] = work()
+        finally:
+            done.set()
+
+    def _poll():
+        if not done.is_set():
+            root.after(POLL_MS, _poll)
+            return
+        flush_network_errors()
+        on_done(result[0])
+
+    threading.Thread(target=_bg, daemon=True).start()
+    root.after(POLL_MS, _poll)
+
+
 # ===========================
 # BACKGROUND & THEME
 # ===========================
 
+@functools.lru_cache(maxsize=64)
+def hex_to_rgb(h: str) -> Tuple[int, int, int]:
+    h = h.lstrip("#")
+    return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
+
+
+# sRGB channel (0-255) -> linear light, approximating the sRGB curve with gamma 2.2
+SRGB_TO_LINEAR = tuple((i / 255.0) ** 2.2 for i in range(256))
+
+
+@functools.lru_cache(maxsize=1024)
+def interpolate(c1: str, c2: str, t: float) -> str:
+    """Blend two hex colours in linear light, so midtones don't turn muddy."""
+    lin = SRGB_TO_LINEAR
+    r1, g1, b1 = hex_to_rgb(c1)
+    r2, g2, b2 = hex_to_rgb(c2)
+    r = lin[r1] + (lin[r2] - lin[r1]) * t
+    g = lin[g1] + (lin[g2] - lin[g1]) * t
+    b = lin[b1] + (lin[b2] - lin[b1]) * t
+    inv = 1 / 2.2
+    return f"#{round(255 * r ** inv):02x}{round(255 * g ** inv):02x}{round(255 * b ** inv):02x}"
+
+
+@functools.lru_cache(maxsize=64)
+def luminance(c: str) -> float:
+    r, g, b = hex_to_rgb(c)
+    return (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
+
+
+def _sky_kind(code: Optional[int]) -> str:
+    if code in (0, 1):
+        return "clear"
+    if code in (2, 3, 45, 48):
+        return "cloud"
+    if code and (51 <= code <= 67 or 80 <= code <= 82):
+        return "rain"
+    if code and (71 <= code <= 77 or 85 <= code <= 86):
+        return "snow"
+    if code and code >= 95:
+        return "storm"
+    return "other"
+
+
+# Colours per (is_night, sky kind): window background and wallpaper
+# gradient (top, bottom).
+_BG_COLOURS: Dict[Tuple[bool, str], str] = {
+    (False, "clear"): "#dbeafe",
+    (False, "cloud"): "#e5e7eb",
+    (False, "rain"): "#e0f2fe",
+    (False, "snow"): "#f1f5f9",
+    (False, "storm"): "#e5e7eb",
+    (False, "other"): "#e5f0ff",
+}
+for _kind in ("clear", "cloud", "rain", "snow", "storm", "other"):
+    _BG_COLOURS[(True, _kind)] = "#020617"
+
+_WALLPAPER_COLOURS: Dict[Tuple[bool, str], Tuple[str, str]] = {
+    (True, "clear"): ("#020617", "#111827"),
+    (True, "cloud"): ("#111827", "#4b5563"),
+    (True, "rain"): ("#020617", "#1f2937"),
+    (True, "snow"): ("#0b1120", "#e5e7eb"),
+    (True, "storm"): ("#020617", "#111827"),
+    (True, "other"): ("#020617", "#111827"),
+    (False, "clear"): ("#38bdf8", "#e0f2fe"),
+    (False, "cloud"): ("#d1d5db", "#e5e7eb"),
+    (False, "rain"): ("#1d4ed8", "#93c5fd"),
+    (False, "snow"): ("#e5f0ff", "#f9fafb"),
+    (False, "storm"): ("#111827", "#4b5563"),
+    (False, "other"): ("#60a5fa", "#bfdbfe"),
+}
+
+
+def _wallpaper_entry(top_col: str, bottom_col: str) -> Tuple[str, str, str]:
+    """(top, bottom, text colour): light text on gradients whose midpoint is dark."""
+    fg = "#f9fafb" if luminance(interpolate(top_col, bottom_col, 0.5)) < 0.5 else "#111827"
+    return (top_col, bottom_col, fg)
+
+
+# Expanded once over every weather code, so a redraw is a single lookup
+# keyed by (is_night, code). Codes outside the table fall back to _sky_kind.
+BG_TABLE: Dict[Tuple[bool, Optional[int]], str] = {}
+WALLPAPER_TABLE: Dict[Tuple[bool, Optional[int]], Tuple[str, str, str]] = {}
+_wallpaper_entries = {key: _wallpaper_entry(*cols) for key, cols in _WALLPAPER_COLOURS.items()}
+for _night in (False, True):
+    for _code in [None, *range(100)]:
+        _kind = _sky_kind(_code)
+        BG_TABLE[(_night, _code)] = _BG_COLOURS[(_night, _kind)]
+        WALLPAPER_TABLE[(_night, _code)] = _wallpaper_entries[(_night, _kind)]
+
+
 def choose_weather_background(code: Optional[int], is_day: Optional[int]) -> str:
-    if is_day == 0:
-        return "#020617"
-    else:
-        if code in (0, 1):
-            return "#dbeafe"
-        if code in (2, 3, 45, 48):
-            return "#e5e7eb"
-        if code and (51 <= code <= 67 or 80 <= code <= 82):
-            return "#e0f2fe"
-        if code and (71 <= code <= 77 or 85 <= code <= 86):
-            return "#f1f5f9"
-        if code and code >= 95:
-            return "#e5e7eb"
-        return "#e5f0ff"
+    night = is_day == 0
+    bg = BG_TABLE.get((night, code))
+    return bg if bg is not None else _BG_COLOURS[(night, _sky_kind(code))]
+
+
+def wallpaper_colours(code: Optional[int], is_day: Optional[int]) -> Tuple[str, str, str]:
+    night = is_day == 0
+    cols = WALLPAPER_TABLE.get((night, code))
+    return cols if cols is not None else _wallpaper_entries[(night, _sky_kind(code))]
 
 
 def load_wallpapers() -> None:
@@ -796,9 +1221,36 @@ def style_day_buttons() -> None:
                        bg=theme["card_bg"])
 
 
-def update_wallpaper(code: Optional[int], is_day: Optional[int]) -> None:
-    wallpaper_canvas.delete("all")
+# Gradient helpers. Only a dozen colour pairs exist and the stripe positions
+# are fixed, so every colour maths result is reused across redraws.
+WALLPAPER_STRIPES = 40
+WALLPAPER_TS = tuple(i / (WALLPAPER_STRIPES - 1) for i in range(WALLPAPER_STRIPES))
+
+
+_gradient_cache: Dict[Tuple[str, str, int, int], tk.PhotoImage] = {}
+
 
+def gradient_image(top_col: str, bottom_col: str, width: int, height: int) -> tk.PhotoImage:
+    """
+    The striped wallpaper gradient rendered once into a PhotoImage, cached
+    per colour pair and size. Each stripe is a single put() tiled over its rows.
+    """
+    key = (top_col, bottom_col, width, height)
+    img = _gradient_cache.get(key)
+    if img is None:
+        if len(_gradient_cache) >= 24:  # window resizes keep adding sizes
+            _gradient_cache.clear()
+        img = tk.PhotoImage(master=wallpaper_canvas, width=width, height=height)
+        for i, t in enumerate(WALLPAPER_TS):
+            y0 = int(t * height)
+            y1 = int((i + 1) / WALLPAPER_STRIPES * height)
+            if y0 != y1:
+                img.put(interpolate(top_col, bottom_col, t), to=(0, min(y0, y1), width, max(y0, y1)))
+        _gradient_cache[key] = img
+    return img
+
+
+def update_wallpaper(code: Optional[int], is_day: Optional[int]) -> None:
     width = wallpaper_canvas.winfo_width()
     height = wallpaper_canvas.winfo_height()
     if width < 300:
@@ -806,77 +1258,7 @@ def update_wallpaper(code: Optional[int], is_day: Optional[int]) -> None:
     if height < 120:
         height = 220
 
-    def hex_to_rgb(h: str):
-        h = h.lstrip("#")
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-
-    def interpolate(c1: str, c2: str, t: float) -> str:
-        r1, g1, b1 = hex_to_rgb(c1)
-        r2, g2, b2 = hex_to_rgb(c2)
-        r = int(r1 + (r2 - r1) * t)
-        g = int(g1 + (g2 - g1) * t)
-        b = int(b1 + (b2 - b1) * t)
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def luminance(c: str) -> float:
-        r, g, b = hex_to_rgb(c)
-        return (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
-
-    top_col = "#60a5fa"
-    bottom_col = "#bfdbfe"
-
-    if is_day == 0:
-        if code in (0, 1):
-            top_col = "#020617"
-            bottom_col = "#111827"
-        elif code in (2, 3, 45, 48):
-            top_col = "#111827"
-            bottom_col = "#4b5563"
-        elif code and (51 <= code <= 67 or 80 <= code <= 82):
-            top_col = "#020617"
-            bottom_col = "#1f2937"
-        elif code and (71 <= code <= 77 or 85 <= code <= 86):
-            top_col = "#0b1120"
-            bottom_col = "#e5e7eb"
-        elif code and code >= 95:
-            top_col = "#020617"
-            bottom_col = "#111827"
-        else:
-            top_col = "#020617"
-            bottom_col = "#111827"
-    else:
-        if code in (0, 1):
-            top_col = "#38bdf8"
-            bottom_col = "#e0f2fe"
-        elif code in (2, 3, 45, 48):
-            top_col = "#d1d5db"
-            bottom_col = "#e5e7eb"
-        elif code and (51 <= code <= 67 or 80 <= code <= 82):
-            top_col = "#1d4ed8"
-            bottom_col = "#93c5fd"
-        elif code and (71 <= code <= 77 or 85 <= code <= 86):
-            top_col = "#e5f0ff"
-            bottom_col = "#f9fafb"
-        elif code and code >= 95:
-            top_col = "#111827"
-            bottom_col = "#4b5563"
-        else:
-            top_col = "#60a5fa"
-            bottom_col = "#bfdbfe"
-
-    stripes = 40
-    for i in range(stripes):
-        t = i / max(1, stripes - 1)
-        colour = interpolate(top_col, bottom_col, t)
-        y0 = int(t * height)
-        y1 = int((i + 1) / max(1, stripes) * height)
-        wallpaper_canvas.create_rectangle(0, y0, width, y1, fill=colour, outline="")
-
-    mid_color = interpolate(top_col, bottom_col, 0.5)
-    if luminance(mid_color) < 0.5:
-        fg = "#f9fafb"
-    else:
-        fg = "#111827"
+    top_col, bottom_col, fg = wallpaper_colours(code, is_day)
 
     global last_forecast, last_location
     desc = weather_text(code)
@@ -893,27 +1275,35 @@ def update_wallpaper(code: Optional[int], is_day: Optional[int]) -> None:
     if last_location and isinstance(last_location, dict):
         loc_text = format_location(last_location)
 
-    wallpaper_canvas.create_text(
-        width / 2,
-        height * 0.32,
+    # Theme/units toggles and refreshes keep the same four items and only
+    # swap their image/text/colour.
+    c = wallpaper_canvas
+    begin_canvas_items(c, (bool(temp_text), bool(loc_text)))
+
+    canvas_item(c, "gradient", "image", (0, 0),
+                image=gradient_image(top_col, bottom_col, width, height), anchor="nw")
+
+    canvas_item(
+        c, "desc", "text",
+        (width / 2, height * 0.32),
         text=f"{emoji}  {desc}",
         fill=fg,
         font=("Arial", 20, "bold")
     )
 
     if temp_text:
-        wallpaper_canvas.create_text(
-            width / 2,
-            height * 0.52,
+        canvas_item(
+            c, "temp", "text",
+            (width / 2, height * 0.52),
             text=temp_text,
             fill=fg,
             font=("Arial", 16)
         )
 
     if loc_text:
-        wallpaper_canvas.create_text(
-            width / 2,
-            height * 0.7,
+        canvas_item(
+            c, "loc", "text",
+            (width / 2, height * 0.7),
             text=loc_text,
             fill=fg,
             font=("Arial", 11)
@@ -923,38 +1313,33 @@ def update_wallpaper(code: Optional[int], is_day: Optional[int]) -> None:
 def apply_theme() -> None:
     theme = THEMES[theme_mode]
     bg = weather_bg or theme["bg"]
+    card_bg, fg, accent = theme["card_bg"], theme["fg"], theme["accent"]
+    text_bg, text_fg = theme["text_bg"], theme["text_fg"]
 
     root.configure(bg=bg)
     content_canvas.configure(bg=bg, highlightbackground=bg)
 
-    top_frame.configure(bg=theme["card_bg"])
-    for w in top_frame.winfo_children():
-        if isinstance(w, tk.Label):
-            w.configure(bg=theme["card_bg"], fg=theme["fg"])
-        elif isinstance(w, tk.Button):
-            text = w.cget("text")
-            if "Get Weather" in text or "Loading" in text:
-                w.configure(bg=theme["accent"], fg="#ffffff", activebackground=theme["accent"])
-            else:
-                w.configure(bg=theme["card_bg"], fg=theme["fg"], activebackground=theme["card_bg"])
+    top_frame.configure(bg=card_bg)
+    for w in top_labels:
+        w.configure(bg=card_bg, fg=fg)
+    for w in top_buttons:
+        w.configure(bg=card_bg, fg=fg, activebackground=card_bg)
+    get_button.configure(bg=accent, fg="#ffffff", activebackground=accent)
 
-    city_entry.configure(bg=theme["text_bg"], fg=theme["text_fg"], insertbackground=theme["text_fg"])
-    last_updated_label.configure(bg=bg, fg=theme["fg"])
+    city_entry.configure(bg=text_bg, fg=text_fg, insertbackground=text_fg)
+    last_updated_label.configure(bg=bg, fg=fg)
 
-    favourites_frame.configure(bg=theme["card_bg"])
-    for w in favourites_frame.winfo_children():
-        if isinstance(w, tk.Label):
-            w.configure(bg=theme["card_bg"], fg=theme["fg"])
-        elif isinstance(w, tk.Button):
-            w.configure(bg=theme["card_bg"], fg=theme["fg"], activebackground=theme["card_bg"])
+    favourites_frame.configure(bg=card_bg)
+    for w in favourites_labels:
+        w.configure(bg=card_bg, fg=fg)
 
-    favourites_listbox.configure(bg=theme["text_bg"], fg=theme["text_fg"],
-                                 selectbackground=theme["accent"], selectforeground="#ffffff")
+    favourites_listbox.configure(bg=text_bg, fg=text_fg,
+                                 selectbackground=accent, selectforeground="#ffffff")
 
-    header_frame.configure(bg=theme["card_bg"])
-    header_text_frame.configure(bg=theme["card_bg"])
+    header_frame.configure(bg=card_bg)
+    header_text_frame.configure(bg=card_bg)
     for w in (icon_label, big_temp_label, location_label, hi_lo_label, micro_summary_label, alert_label):
-        w.configure(bg=theme["card_bg"], fg=theme["fg"])
+        w.configure(bg=card_bg, fg=fg)
 
     for frame in (
         current_frame, forecast_frame, ten_day_overview_frame, hourly_frame,
@@ -963,12 +1348,12 @@ def apply_theme() -> None:
         suggestions_frame, wallpaper_frame,
         compare_frame
     ):
-        frame.configure(bg=theme["card_bg"], fg=theme["fg"])
+        frame.configure(bg=card_bg, fg=fg)
 
     for txt in (current_text, forecast_text, ten_day_overview_text,
                 activities_text, suggestions_text,
                 story_text, compare_text):
-        txt.configure(bg=theme["text_bg"], fg=theme["text_fg"], insertbackground=theme["text_fg"])
+        txt.configure(bg=text_bg, fg=text_fg, insertbackground=text_fg)
 
     for cv in (
         forecast_canvas, hourly_strip_canvas,
@@ -976,48 +1361,87 @@ def apply_theme() -> None:
         hourly_uv_canvas, hourly_wind_canvas, hourly_humid_canvas, hourly_comfort_canvas,
         sun_canvas, wind_canvas, wallpaper_canvas
     ):
-        cv.configure(bg=theme["card_bg"], highlightbackground=theme["card_bg"])
+        cv.configure(bg=card_bg, highlightbackground=card_bg)
 
-    day_selector_frame.configure(bg=theme["card_bg"])
-    day_label.configure(bg=theme["card_bg"], fg=theme["fg"])
+    day_selector_frame.configure(bg=card_bg)
+    day_label.configure(bg=card_bg, fg=fg)
     for btn in day_buttons:
-        btn.configure(bg=theme["card_bg"], fg=theme["fg"], activebackground=theme["card_bg"])
+        btn.configure(bg=card_bg, fg=fg, activebackground=card_bg)
 
-    sun_text_label.configure(bg=theme["card_bg"], fg=theme["fg"])
-    wind_text_label.configure(bg=theme["card_bg"], fg=theme["fg"])
-    air_text_label.configure(bg=theme["card_bg"], fg=theme["fg"])
-    moon_text_label.configure(bg=theme["card_bg"], fg=theme["fg"])
+    sun_text_label.configure(bg=card_bg, fg=fg)
+    wind_text_label.configure(bg=card_bg, fg=fg)
+    air_text_label.configure(bg=card_bg, fg=fg)
+    moon_text_label.configure(bg=card_bg, fg=fg)
 
-    footer_label.configure(bg=bg, fg=theme["fg"])
+    footer_label.configure(bg=bg, fg=fg)
     style_day_buttons()
 
 
-def toggle_theme() -> None:
-    global theme_mode
-    theme_mode = "dark" if theme_mode == "light" else "light"
-    save_settings()
+# Toggle redraws are coalesced: the toggles only flip state and schedule one
+# idle-time redraw, so Tk paints the button first and repeated presses in
+# one tick share a single redraw (or none, if they cancel out).
+_redraw_pending = False
+_last_rendered_signature: Optional[Tuple[str, str, int]] = None
+
+
+def render_signature() -> Tuple[str, str, int]:
+    return (theme_mode, units_mode, id(last_forecast))
+
+
+def schedule_redraw() -> None:
+    global _redraw_pending
+    if _redraw_pending:
+        return
+    _redraw_pending = True
+    root.after_idle(_redraw_if_dirty)
+
+
+def _redraw_if_dirty() -> None:
+    global _redraw_pending, _last_rendered_signature
+    _redraw_pending = False
+    old = _last_rendered_signature
+    sig = render_signature()
+    if sig == old:
+        return
+    if last_forecast is not None and last_location is not None and (old is None or old[1:] != sig[1:]):
+        # Units (or the forecast) changed: every panel's text changes too.
+        render_weather(last_location, last_forecast, last_air)
+        return
     apply_theme()
+    redraw_themed_panels()
+    _last_rendered_signature = sig
+
+
+def redraw_themed_panels() -> None:
+    """Redraw the canvases/cards that bake theme colours in, keeping the selected day."""
     if last_forecast is not None:
-        draw_12day_chart(last_forecast.get("daily") or {})
+        draw_12day_chart(last_forecast)
         redraw_hourly_graphs(last_forecast)
         draw_hourly_strip(last_forecast)
         draw_sunrise_card(last_forecast)
         draw_wind_card(last_forecast)
-        draw_air_card(last_air)
+        if show_air_panel:
+            draw_air_card(last_air)
         draw_moon_card(last_forecast)
-        set_text(story_text, generate_story_text(last_forecast))
+        if show_story_panel:
+            set_text(story_text, generate_story_text(last_forecast))
         set_text(ten_day_overview_text, generate_12day_overview(last_forecast))
         current = last_forecast.get("current") or {}
         update_wallpaper(current.get("weather_code"), current.get("is_day"))
 
 
+def toggle_theme() -> None:
+    global theme_mode
+    theme_mode = "dark" if theme_mode == "light" else "light"
+    save_settings()
+    schedule_redraw()
+
+
 def toggle_units() -> None:
-    global units_mode
-    units_mode = "imperial" if units_mode == "metric" else "metric"
+    set_units_mode("imperial" if units_mode == "metric" else "metric")
     units_button.config(text=f"Units: {'Metric' if units_mode == 'metric' else 'Imperial'}")
     save_settings()
-    if last_forecast is not None and last_location is not None:
-        render_weather(last_location, last_forecast, last_air)
+    schedule_redraw()
 
 
 # ===========================
@@ -1025,16 +1449,299 @@ def toggle_units() -> None:
 # ===========================
 
 def set_text(widget: tk.Text, text: str) -> None:
+    # Unchanged text (e.g. a units toggle that leaves a panel alone) skips
+    # the widget entirely; otherwise swap the buffer in one replace call.
+    if getattr(widget, "_last_text", None) == text:
+        return
     widget.config(state="normal")
-    widget.delete("1.0", tk.END)
-    widget.insert("1.0", text)
+    widget.replace("1.0", tk.END, text)
     widget.config(state="disabled")
+    widget._last_text = text
+
+
+@functools.lru_cache(maxsize=512)
+def parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """
+    datetime.fromisoformat, memoised (None for missing/bad values).
+    The same forecast dates are re-parsed on every redraw and units/theme toggle.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def weekday_label(date_str: Optional[str]) -> Optional[str]:
+    """Short weekday ("Mon") for an ISO date, or the input itself if it doesn't parse."""
+    dt = parse_iso(date_str)
+    return dt.strftime("%a") if dt else date_str
+
+
+def clear_canvas(canvas: tk.Canvas) -> None:
+    canvas.delete("all")
+    canvas._item_layout = None
+    canvas._items = {}
+    canvas._draw_sig = None
+
+
+def blank_canvas(canvas: tk.Canvas) -> None:
+    """clear_canvas() that is free when the canvas is already blank (hidden or no data)."""
+    if getattr(canvas, "_draw_sig", None) != "blank":
+        clear_canvas(canvas)
+        canvas._draw_sig = "blank"
+
+
+def canvas_up_to_date(canvas: tk.Canvas, signature: Any) -> bool:
+    """True if the canvas already shows `signature`; otherwise records it for this redraw."""
+    if getattr(canvas, "_draw_sig", None) == signature:
+        return True
+    canvas._draw_sig = signature
+    return False
+
+
+def begin_canvas_items(canvas: tk.Canvas, layout: Any) -> None:
+    """
+    Start a redraw that reuses the canvas's existing items. The canvas is
+    only cleared when the layout (item count/shape) differs from last time.
+    """
+    if getattr(canvas, "_item_layout", None) != layout:
+        clear_canvas(canvas)
+        canvas._item_layout = layout
+
+
+def canvas_item(canvas: tk.Canvas, key: Any, kind: str, coords: Tuple[float, ...], **opts) -> int:
+    """Create item `key` on first use; afterwards only push changed coords/options."""
+    entry = canvas._items.get(key)
+    if entry is None:
+        item_id = getattr(canvas, "create_" + kind)(*coords, **opts)
+        canvas._items[key] = [item_id, coords, opts]
+        return item_id
+    item_id, old_coords, old_opts = entry
+    if coords != old_coords:
+        canvas.coords(item_id, *coords)
+        entry[1] = coords
+    if opts != old_opts:
+        canvas.itemconfigure(item_id, **opts)
+        entry[2] = opts
+    return item_id
+
+
+def project_points(values: List[float], left: float, bottom: float,
+                   usable_w: float, usable_h: float,
+                   vmin: float, vmax: float) -> List[float]:
+    """
+    Flat [x0, y0, x1, y1, ...] canvas coords for evenly spaced values
+    (needs at least two values and vmax != vmin). Ready for create_line.
+    """
+    n = len(values)
+    x_step = usable_w / (n - 1)
+    y_scale = usable_h / (vmax - vmin)
+    flat = [0.0] * (2 * n)
+    flat[0::2] = [left + i * x_step for i in range(n)]
+    flat[1::2] = [bottom - (v - vmin) * y_scale for v in values]
+    return flat
+
+
+def _num_or_none(v: Any) -> Optional[float]:
+    return v if isinstance(v, (int, float)) else None
+
+
+def _first(d: Dict[str, Any], key: str) -> Any:
+    """First entry of the list d[key] (e.g. today's daily value), or None."""
+    values = d.get(key)
+    return values[0] if values else None
+
+
+def forecast_view(forecast: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Struct-of-arrays view of the forecast, built once per forecast object.
+    Daily fields are aligned to n_days entries and hourly fields (h_*) to
+    hourly_times, with missing/non-numeric values normalised to None, so
+    callers index directly without bounds or type checks.
+    """
+    if _view.get("forecast") is not forecast:
+        _rebuild_forecast_view(forecast)
+    return _view
+
+
+def _rebuild_forecast_view(forecast: Dict[str, Any]) -> None:
+    daily = forecast.get("daily") or {}
+    dates = daily.get("time") or []
+    n = min(FORECAST_DAYS, len(dates))
+
+    def column(key: str, keep=_num_or_none) -> List[Any]:
+        values = daily.get(key) or []
+        return [keep(values[i]) if i < len(values) else None for i in range(n)]
+
+    def text_or_none(v: Any) -> Optional[str]:
+        return v if isinstance(v, str) else None
+
+    _view.clear()
+    _view.update({
+        "forecast": forecast,
+        "n_days": n,
+        "dates": list(dates[:n]),
+        "code": column("weather_code"),
+        "tmax": column("temperature_2m_max"),
+        "tmin": column("temperature_2m_min"),
+        "app_max": column("apparent_temperature_max"),
+        "app_min": column("apparent_temperature_min"),
+        "uv": column("uv_index_max"),
+        "rain": column("precipitation_sum"),
+        "rain_prob": column("precipitation_probability_max"),
+        "wind": column("wind_speed_10m_max"),
+        "sunrise": column("sunrise", text_or_none),
+        "sunset": column("sunset", text_or_none),
+    })
+
+    def day_label(date_str: Any) -> Any:
+        dt = parse_iso(date_str)
+        return dt.strftime("%a %d %b") if dt else date_str
+
+    # "Mon 14 Oct" per day, shared by the daily text and the overview.
+    _view["day_labels"] = [day_label(d) for d in _view["dates"]]
+    _view["d_icons"] = [weather_icon(c) for c in _view["code"]]
+    _view["d_texts"] = [weather_text(c) for c in _view["code"]]
+
+    # Today's sunrise/sunset strings and their parsed datetimes (None if
+    # either is malformed), so sun card repaints skip fromisoformat.
+    sunrise_list = daily.get("sunrise") or []
+    sunset_list = daily.get("sunset") or []
+    sun_day = None
+    if sunrise_list and sunset_list:
+        try:
+            sun_dts = (datetime.fromisoformat(sunrise_list[0]), datetime.fromisoformat(sunset_list[0]))
+        except Exception:
+            sun_dts = (None, None)
+        sun_day = (sunrise_list[0], sunset_list[0]) + sun_dts
+    _view["sun_day"] = sun_day
+
+    hourly = forecast.get("hourly") or {}
+    times = hourly.get("time") or []
+    n_hours = len(times)
+
+    def hourly_column(key: str) -> List[Optional[float]]:
+        values = hourly.get(key) or []
+        return [_num_or_none(values[i]) if i < len(values) else None for i in range(n_hours)]
+
+    _view.update({
+        "hourly_times": times,
+        "hourly_sorted": all(isinstance(t, str) for t in times)
+                         and all(a <= b for a, b in zip(times, times[1:])),
+        "day_slices": {},
+        "h_temp": hourly_column("temperature_2m"),
+        "h_feels": hourly_column("apparent_temperature"),
+        "h_hum": hourly_column("relative_humidity_2m"),
+        "h_rain_prob": hourly_column("precipitation_probability"),
+        "h_uv": hourly_column("uv_index"),
+        "h_wind": hourly_column("wind_speed_10m"),
+        "h_code": hourly_column("weather_code"),
+    })
+    # "HH:MM" axis label per hour, shared by the seven graphs and the strip.
+    _view["h_hhmm"] = [
+        t.split("T")[1][:5] if isinstance(t, str) and "T" in t else t for t in times
+    ]
+    # Strip icon per hour; a missing code shows as clear (code 0).
+    _view["h_icons"] = [weather_icon(int(c) if c is not None else 0) for c in _view["h_code"]]
+
+    # Average relative humidity per day, from one pass over the hours
+    # grouped by their "YYYY-MM-DD" date part (None for days without data).
+    hum_sum: Dict[str, float] = {}
+    hum_count: Dict[str, int] = {}
+    for t, h in zip(times, _view["h_hum"]):
+        if h is not None and isinstance(t, str):
+            d = t[:10]
+            hum_sum[d] = hum_sum.get(d, 0) + h
+            hum_count[d] = hum_count.get(d, 0) + 1
+    _view["daily_hum"] = [
+        hum_sum[d] / hum_count[d] if d in hum_sum else None
+        for d in _view["dates"]
+    ]
+
+
+def day_slice(forecast: Dict[str, Any], day: str) -> Tuple[int, int]:
+    """
+    [start, end) of the hourly entries whose time starts with `day`
+    ("YYYY-MM-DD"), cached per forecast. Sorted ISO times let two bisects
+    replace a scan: everything in [day, day + "U") starts with day.
+    """
+    view = forecast_view(forecast)
+    span = view["day_slices"].get(day)
+    if span is None:
+        times = view["hourly_times"]
+        if view["hourly_sorted"]:
+            span = (bisect.bisect_left(times, day), bisect.bisect_left(times, day + "U"))
+        else:
+            idx = [i for i, t in enumerate(times) if isinstance(t, str) and t.startswith(day)]
+            span = (idx[0], idx[-1] + 1) if idx else (0, 0)
+        view["day_slices"][day] = span
+    return span
+
+
+def display_arrays(forecast: Dict[str, Any]) -> Dict[str, Any]:
+    """Unit-converted copies of the plotted series, rebuilt only when needed."""
+    if _display.get("forecast") is not forecast or _display.get("units") != units_mode:
+        _rebuild_display_arrays(forecast)
+    return _display
+
+
+def _rebuild_display_arrays(forecast: Dict[str, Any]) -> None:
+    view = forecast_view(forecast)
+    daily = forecast.get("daily") or {}
+
+    def temps(values):
+        return [to_display_temp(v) if isinstance(v, (int, float)) else v for v in values]
+
+    def winds(values):
+        return [to_display_wind(v) if isinstance(v, (int, float)) else v for v in values]
+
+    _display.clear()
+    _display.update({
+        "forecast": forecast,
+        "units": units_mode,
+        "hourly_temp": temps(view["h_temp"]),
+        "hourly_feels": temps(view["h_feels"]),
+        "hourly_wind": winds(view["h_wind"]),
+        "daily_tmax": temps(daily.get("temperature_2m_max") or []),
+        "daily_tmin": temps(daily.get("temperature_2m_min") or []),
+    })
+
+
+def comfort_series(forecast: Dict[str, Any]) -> List[Optional[float]]:
+    """Hourly comfort index for the forecast, computed on first use per forecast/units."""
+    disp = display_arrays(forecast)
+    if "comfort" not in disp:
+        view = forecast_view(forecast)
+        disp["comfort"] = compute_comfort_series(
+            view["h_temp"], view["h_hum"], view["h_wind"], view["h_uv"], view["h_rain_prob"],
+        )
+    return disp["comfort"]
+
+
+def per_forecast_text(builder: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize a forecast -> text builder next to display_arrays(), i.e. per
+    forecast object and units mode (plus any extra hashable arguments).
+    Theme toggles and repeat renders reuse it.
+    """
+    @functools.wraps(builder)
+    def wrapper(forecast: Dict[str, Any], *args: Any) -> str:
+        texts = display_arrays(forecast).setdefault("texts", {})
+        key = (builder.__name__,) + args
+        text = texts.get(key)
+        if text is None:
+            text = texts[key] = builder(forecast, *args)
+        return text
+    return wrapper
 
 
 def format_location(loc: Dict[str, Any]) -> str:
-    name = loc.get("name") or ""
-    admin1 = loc.get("admin1") or ""
-    country = loc.get("country") or ""
+    return _format_location(loc.get("name") or "", loc.get("admin1") or "", loc.get("country") or "")
+
+
+@functools.lru_cache(maxsize=256)
+def _format_location(name: str, admin1: str, country: str) -> str:
     parts = [name]
     if admin1:
         parts.append(admin1)
@@ -1048,6 +1755,17 @@ def format_location(loc: Dict[str, Any]) -> str:
 # ===========================
 
 def save_settings() -> None:
+    """Schedule a settings write; repeated calls within SETTINGS_SAVE_DELAY_MS coalesce."""
+    global _settings_save_id
+    if _settings_save_id is not None:
+        root.after_cancel(_settings_save_id)
+    _settings_save_id = root.after(SETTINGS_SAVE_DELAY_MS, flush_settings)
+
+
+def flush_settings() -> None:
+    """Write the settings file now, via a temp file and os.replace so it is never left truncated."""
+    global _settings_save_id, _settings_written
+    _settings_save_id = None
     data = {
         "theme_mode": theme_mode,
         "units_mode": units_mode,
@@ -1058,23 +1776,27 @@ def save_settings() -> None:
         "show_story_panel": show_story_panel,
         "show_activities_panel": show_activities_panel,
     }
+    text = json.dumps(data, separators=(",", ":"))
+    if text == _settings_written:
+        return
+    tmp_path = SETTINGS_FILE + ".tmp"
     try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, SETTINGS_FILE)
     except OSError:
-        pass
+        return
+    _settings_written = text
 
 
 def load_settings() -> None:
-    global theme_mode, units_mode, favourites, last_location
+    global theme_mode, favourites, last_location
     global show_air_panel, show_comfort_graph, show_story_panel, show_activities_panel
 
-    if not os.path.exists(SETTINGS_FILE):
-        return
     try:
         with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
-    except (OSError, json.JSONDecodeError):
+    except (OSError, json.JSONDecodeError):  # includes FileNotFoundError on first run
         return
 
     tm = data.get("theme_mode")
@@ -1085,13 +1807,14 @@ def load_settings() -> None:
     if tm in ("light", "dark"):
         theme_mode = tm
     if um in ("metric", "imperial"):
-        units_mode = um
+        set_units_mode(um)
 
     if isinstance(fav, list):
         favourites.clear()
         for item in fav:
             if isinstance(item, dict) and "latitude" in item and "longitude" in item:
                 favourites.append(item)
+        rebuild_favourite_keys()
 
     if isinstance(last, dict) and "latitude" in last and "longitude" in last:
         last_location = last
@@ -1115,50 +1838,47 @@ def load_settings() -> None:
 def auto_load_last_location() -> None:
     if last_location is None:
         return
-    loc = last_location
-    forecast = fetch_weather_cached(loc["latitude"], loc["longitude"], loc["timezone"])
-    if not forecast:
-        return
-    air = fetch_air_quality(loc["latitude"], loc["longitude"], loc["timezone"])
-    city_entry.delete(0, tk.END)
-    city_entry.insert(0, format_location(loc))
-    render_weather(loc, forecast, air)
+    load_location(last_location)
 
 
 # ===========================
 # SETTINGS DIALOG & PANEL VISIBILITY
 # ===========================
 
-def update_panel_visibility() -> None:
-    global show_air_panel, show_comfort_graph, show_story_panel, show_activities_panel
-
-    if show_air_panel:
-        if not air_frame.winfo_ismapped():
-            air_frame.pack(fill="x", padx=10, pady=5)
-    else:
-        if air_frame.winfo_ismapped():
-            air_frame.pack_forget()
+# Whether each optional panel is currently packed (all are packed at GUI
+# setup). Tracked here so unchanged panels cost no winfo_ismapped() round-trip.
+_panel_state: Dict[str, bool] = {"air": True, "story": True, "activities": True, "comfort": True}
 
-    if show_story_panel:
-        if not story_frame.winfo_ismapped():
-            story_frame.pack(fill="both", padx=10, pady=5)
-    else:
-        if story_frame.winfo_ismapped():
-            story_frame.pack_forget()
 
-    if show_activities_panel:
-        if not activities_frame.winfo_ismapped():
-            activities_frame.pack(fill="both", padx=10, pady=5)
-    else:
-        if activities_frame.winfo_ismapped():
-            activities_frame.pack_forget()
+def update_panel_visibility() -> None:
+    """
+    Pack or forget only the optional panels whose setting changed.
+    The changes are made back to back, in layout order, so Tk lays the
+    page out once at idle time instead of once per panel.
+    """
+    wanted = {
+        "comfort": show_comfort_graph,
+        "air": show_air_panel,
+        "story": show_story_panel,
+        "activities": show_activities_panel,
+    }
+    changed = [(name, bool(show)) for name, show in wanted.items() if _panel_state[name] != bool(show)]
+    if not changed:
+        return
 
-    if show_comfort_graph:
-        if not hourly_comfort_canvas.winfo_ismapped():
-            hourly_comfort_canvas.pack(fill="x", pady=3)
-    else:
-        if hourly_comfort_canvas.winfo_ismapped():
-            hourly_comfort_canvas.pack_forget()
+    panels = {
+        "comfort": (hourly_comfort_canvas, {"fill": "x", "pady": 3}),
+        "air": (air_frame, {"fill": "x", "padx": 10, "pady": 5}),
+        "story": (story_frame, {"fill": "both", "padx": 10, "pady": 5}),
+        "activities": (activities_frame, {"fill": "both", "padx": 10, "pady": 5}),
+    }
+    for name, show in changed:
+        widget, pack_opts = panels[name]
+        if show:
+            widget.pack(**pack_opts)
+        else:
+            widget.pack_forget()
+        _panel_state[name] = show
 
 
 def open_settings() -> None:
@@ -1197,6 +1917,7 @@ def open_settings() -> None:
     tk.Checkbutton(adv_frame, text="Show activities card", variable=act_var).pack(anchor="w")
 
     def on_ok():
+        global theme_mode, show_air_panel, show_comfort_graph, show_story_panel, show_activities_panel
         nonlocal theme_var, units_var, air_var, comfort_var, story_var, act_var
 
         new_theme = theme_var.get()
@@ -1207,22 +1928,24 @@ def open_settings() -> None:
         new_act = act_var.get()
 
         if new_theme in ("light", "dark") and new_theme != theme_mode:
-            globals()["theme_mode"] = new_theme
+            theme_mode = new_theme
 
         if new_units in ("metric", "imperial") and new_units != units_mode:
-            globals()["units_mode"] = new_units
+            set_units_mode(new_units)
             units_button.config(text=f"Units: {'Metric' if new_units == 'metric' else 'Imperial'}")
 
-        globals()["show_air_panel"] = bool(new_air)
-        globals()["show_comfort_graph"] = bool(new_comfort)
-        globals()["show_story_panel"] = bool(new_story)
-        globals()["show_activities_panel"] = bool(new_act)
+        show_air_panel = bool(new_air)
+        show_comfort_graph = bool(new_comfort)
+        show_story_panel = bool(new_story)
+        show_activities_panel = bool(new_act)
 
         save_settings()
         apply_theme()
-        update_panel_visibility()
         if last_forecast is not None and last_location is not None:
+            # The render repacks the panels itself, inside its single layout pass.
             render_weather(last_location, last_forecast, last_air)
+        else:
+            update_panel_visibility()
 
         dialog.destroy()
 
@@ -1239,16 +1962,21 @@ def open_settings() -> None:
 # FAVOURITES
 # ===========================
 
+def rebuild_favourite_keys() -> None:
+    favourite_keys.clear()
+    favourite_keys.update(format_location(f) for f in favourites)
+
+
 def add_favourite() -> None:
     if last_location is None:
         messagebox.showinfo("No location", "Get the weather first, then add to favourites.")
         return
     display = format_location(last_location)
-    for f in favourites:
-        if format_location(f) == display:
-            messagebox.showinfo("Already added", "This place is already in favourites.")
-            return
+    if display in favourite_keys:
+        messagebox.showinfo("Already added", "This place is already in favourites.")
+        return
     favourites.append(last_location.copy())
+    favourite_keys.add(display)
     favourites_listbox.insert(tk.END, display)
     save_settings()
 
@@ -1260,6 +1988,7 @@ def remove_favourite() -> None:
     idx = sel[0]
     favourites_listbox.delete(idx)
     del favourites[idx]
+    rebuild_favourite_keys()
     save_settings()
 
 
@@ -1268,14 +1997,12 @@ def load_selected_favourite(event=None) -> None:
     if not sel:
         return
     idx = sel[0]
-    loc = favourites[idx]
-    forecast = fetch_weather_cached(loc["latitude"], loc["longitude"], loc["timezone"])
-    if not forecast:
-        return
-    air = fetch_air_quality(loc["latitude"], loc["longitude"], loc["timezone"])
-    city_entry.delete(0, tk.END)
-    city_entry.insert(0, format_location(loc))
-    render_weather(loc, forecast, air)
+    load_location(favourites[idx])
+
+
+# One row of the compare table; the header is the same template over the column titles.
+COMPARE_ROW_TMPL = "{name:<28} {hi:>10} {lo:>10} {rp:>7} {wd:>11} {uv:>5}"
+COMPARE_HEADER = COMPARE_ROW_TMPL.format(name="Place", hi="High", lo="Low", rp="Rain%", wd="Wind", uv="UV")
 
 
 def compare_favourites() -> None:
@@ -1294,10 +2021,21 @@ def compare_favourites() -> None:
     else:
         chosen_indices = list(range(min(3, len(favourites))))
 
+    # Fetch all chosen favourites in parallel, then build rows in list order
+    futures = {}
+    for idx in chosen_indices:
+        loc = favourites[idx]
+        fut = EXECUTOR.submit(fetch_weather_cached, loc["latitude"], loc["longitude"], loc["timezone"], "compare")
+        futures[fut] = idx
+    forecasts: Dict[int, Optional[Dict[str, Any]]] = {}
+    for fut in as_completed(futures):
+        forecasts[futures[fut]] = fut.result()
+    flush_network_errors()
+
     rows = []
     for idx in chosen_indices:
         loc = favourites[idx]
-        fc = fetch_weather_cached(loc["latitude"], loc["longitude"], loc["timezone"])
+        fc = forecasts.get(idx)
         if not fc:
             continue
         daily = fc.get("daily") or {}
@@ -1320,23 +2058,24 @@ def compare_favourites() -> None:
         set_text(compare_text, "No data could be fetched for the selected favourites.")
         return
 
-    lines = []
-    lines.append("Comparing today's forecast (uses current units):\n")
-    header = f"{'Place':<28} {'High':>10} {'Low':>10} {'Rain%':>7} {'Wind':>11} {'UV':>5}"
-    lines.append(header)
-    lines.append("-" * len(header))
-
-    for row in rows:
-        name = row["name"][:27] + "…" if len(row["name"]) > 28 else row["name"]
-        hi = fmt_temp_value(row["tmax"])
-        lo = fmt_temp_value(row["tmin"])
-        rp = f"{row['rain_prob']:.0f}%" if isinstance(row["rain_prob"], (int, float)) else "N/A"
-        wd = fmt_wind_value(row["wind_max"])
-        uv = f"{row['uv_max']:.1f}" if isinstance(row["uv_max"], (int, float)) else "N/A"
-        line = f"{name:<28} {hi:>10} {lo:>10} {rp:>7} {wd:>11} {uv:>5}"
-        lines.append(line)
-
-    result_text = "\n".join(lines)
+    num = (int, float)
+    cells = [
+        {
+            "name": row["name"] if len(row["name"]) <= 28 else row["name"][:27] + "…",
+            "hi": fmt_temp_value(row["tmax"]),
+            "lo": fmt_temp_value(row["tmin"]),
+            "rp": f"{row['rain_prob']:.0f}%" if isinstance(row["rain_prob"], num) else "N/A",
+            "wd": fmt_wind_value(row["wind_max"]),
+            "uv": f"{row['uv_max']:.1f}" if isinstance(row["uv_max"], num) else "N/A",
+        }
+        for row in rows
+    ]
+    result_text = "\n".join([
+        "Comparing today's forecast (uses current units):\n",
+        COMPARE_HEADER,
+        "-" * len(COMPARE_HEADER),
+        *[COMPARE_ROW_TMPL.format_map(c) for c in cells],
+    ])
     set_text(compare_text, result_text)
 
     theme = THEMES[theme_mode]
@@ -1393,26 +2132,24 @@ def compare_favourites() -> None:
 # 12-DAY CHART (NEW bars)
 # ===========================
 
-def draw_12day_chart(daily: Dict[str, Any]) -> None:
-    dates = daily.get("time") or []
-    tmax = daily.get("temperature_2m_max") or []
-    rain_sum = daily.get("precipitation_sum") or []
+def draw_12day_chart(forecast: Dict[str, Any]) -> None:
+    view = forecast_view(forecast)
+    dates = view["dates"]
+    tmax = display_arrays(forecast)["daily_tmax"]
 
-    forecast_canvas.delete("all")
-    n = min(FORECAST_DAYS, len(dates), len(tmax))
+    n = min(len(dates), len(tmax))
     if n < 2:
+        clear_canvas(forecast_canvas)
         return
 
-    temps = [tmax[i] for i in range(n)]
+    temps = tmax[:n]
     t_min = min(temps)
     t_max = max(temps)
     if t_max == t_min:
         t_max += 1
 
-    rains = [rain_sum[i] if i < len(rain_sum) and isinstance(rain_sum[i], (int, float)) else 0.0 for i in range(n)]
-    r_max = max(rains) if rains else 1.0
-    if r_max == 0:
-        r_max = 1.0
+    rains = [r if r is not None else 0.0 for r in view["rain"][:n]]
+    r_max = max(rains) or 1.0
 
     width = max(int(forecast_canvas.winfo_width()), 400)
     height = max(int(forecast_canvas.winfo_height()), 180)
@@ -1425,55 +2162,42 @@ def draw_12day_chart(daily: Dict[str, Any]) -> None:
     axis = theme["fg"]
     line_color = theme["accent"]
 
-    forecast_canvas.create_line(x_pad, y_pad, x_pad, height-y_pad, fill=axis)
-    forecast_canvas.create_line(x_pad, height-y_pad, width-x_pad, height-y_pad, fill=axis)
+    c = forecast_canvas
+    begin_canvas_items(c, n)
+    canvas_item(c, "y_axis", "line", (x_pad, y_pad, x_pad, height-y_pad), fill=axis)
+    canvas_item(c, "x_axis", "line", (x_pad, height-y_pad, width-x_pad, height-y_pad), fill=axis)
 
-    unit_label = "°C" if units_mode == "metric" else "°F"
-    legend_text = f"Line = daily high ({unit_label})"
-    forecast_canvas.create_text(width-8, 8, text=legend_text, anchor="ne",
-                                fill=axis, font=("Arial", 8, "italic"))
+    legend_text = f"Line = daily high ({temp_unit()})"
+    canvas_item(c, "legend", "text", (width-8, 8), text=legend_text, anchor="ne",
+                fill=axis, font=("Arial", 8, "italic"))
 
-    points = []
-    for i in range(n):
-        tc = temps[i]
-        x = x_pad + usable_w * i / (n-1)
-        y = height - y_pad - usable_h * (tc - t_min) / (t_max - t_min)
-        points.append((x, y))
+    flat = project_points(temps, x_pad, height - y_pad, usable_w, usable_h, t_min, t_max)
+    xs = flat[0::2]
+    ys = flat[1::2]
 
     # NEW: precipitation bars
     bar_base_y = height - y_pad
-    bar_max_h = usable_h * 0.35
-    bar_w = max(6, int(usable_w / n * 0.35))
-
-    for i in range(n):
-        x, _ = points[i]
-        r = rains[i]
-        h_bar = bar_max_h * (r / r_max)
-        forecast_canvas.create_rectangle(
-            x - bar_w/2, bar_base_y - h_bar,
-            x + bar_w/2, bar_base_y,
+    bar_scale = usable_h * 0.35 / r_max
+    half_w = max(6, int(usable_w / n * 0.35)) / 2
+    bar_tops = [bar_base_y - r * bar_scale for r in rains]
+
+    for i, (x, top) in enumerate(zip(xs, bar_tops)):
+        canvas_item(
+            c, ("bar", i), "rectangle",
+            (x - half_w, top, x + half_w, bar_base_y),
             fill=line_color, outline=""
         )
 
-    for i in range(n-1):
-        x1, y1 = points[i]
-        x2, y2 = points[i+1]
-        forecast_canvas.create_line(x1, y1, x2, y2, fill=line_color, width=2)
+    canvas_item(c, "line", "line", tuple(flat), fill=line_color, width=2)
 
-    for i, (x, y) in enumerate(points):
-        tc = temps[i]
-        date_str = dates[i]
-        try:
-            dt = datetime.fromisoformat(date_str)
-            day_label = dt.strftime("%a")
-        except Exception:
-            day_label = date_str
+    for i, (x, y, tc, date_str) in enumerate(zip(xs, ys, temps, dates)):
+        day_label = weekday_label(date_str)
 
-        forecast_canvas.create_oval(x-3, y-3, x+3, y+3, fill=line_color, outline=line_color)
-        forecast_canvas.create_text(x, y-16, text=temp_point_label(tc), fill=axis,
-                                   font=("Arial", 8), anchor="s")
-        forecast_canvas.create_text(x, height-y_pad+6, text=day_label, fill=axis,
-                                   font=("Arial", 9), anchor="n")
+        canvas_item(c, ("dot", i), "oval", (x-3, y-3, x+3, y+3), fill=line_color, outline=line_color)
+        canvas_item(c, ("temp", i), "text", (x, y-16), text=temp_point_label(tc), fill=axis,
+                    font=("Arial", 8), anchor="s")
+        canvas_item(c, ("day", i), "text", (x, height-y_pad+6), text=day_label, fill=axis,
+                    font=("Arial", 9), anchor="n")
 
 
 # ===========================
@@ -1482,29 +2206,27 @@ def draw_12day_chart(daily: Dict[str, Any]) -> None:
 
 def draw_hourly_graph(
     canvas: tk.Canvas,
-    times: List[str],
+    hours: List[str],
     values: List[Optional[float]],
-    day_date: Optional[str],
     title: str,
     axis_fmt,
     point_fmt,
     legend: str = "",
 ) -> None:
-    canvas.delete("all")
-    if not times or not values:
-        return
-
-    if not isinstance(day_date, str):
-        return
-
+    """
+    Plot one day's series: hours ("HH:MM" labels) and values are already
+    sliced to the selected day, with values numeric or None
+    (forecast_view/display_arrays columns).
+    """
     xs: List[str] = []
     ys: List[float] = []
-    for t, v in zip(times, values):
-        if isinstance(t, str) and t.startswith(day_date) and isinstance(v, (int, float)):
+    for t, v in zip(hours, values):
+        if v is not None:
             xs.append(t)
             ys.append(float(v))
 
     if len(xs) < 2:
+        blank_canvas(canvas)
         return
 
     vmin = min(ys)
@@ -1521,110 +2243,101 @@ def draw_hourly_graph(
     usable_w = width - left - right
     usable_h = height - top - bottom
 
+    # Same point count (e.g. a units toggle or another full day) reuses
+    # every item; only coords/text that changed are pushed to Tk. This runs
+    # before the signature check: a layout change clears the canvas, and
+    # with it the signature, which must then be recorded afresh.
+    n = len(xs)
+    begin_canvas_items(canvas, (n, bool(legend)))
+
+    # Unchanged inputs (e.g. the rain/UV/humidity graphs on a units toggle)
+    # leave the canvas as it is without touching a single item. The axis
+    # label stands in for the formatters' unit suffix.
+    vmax_label = axis_fmt(vmax)
+    if canvas_up_to_date(canvas, (title, legend, tuple(xs), tuple(ys), width, height, theme_mode, vmax_label)):
+        return
+
     theme = THEMES[theme_mode]
     fg = theme["fg"]
     line_color = theme["accent"]
 
-    canvas.create_text(left, 10, text=title, anchor="w", fill=fg, font=("Arial", 10, "bold"))
+    canvas_item(canvas, "title", "text", (left, 10), text=title, anchor="w", fill=fg,
+                font=("Arial", 10, "bold"))
     if legend:
-        canvas.create_text(width-10, 10, text=legend, anchor="ne", fill=fg,
-                           font=("Arial", 8, "italic"))
+        canvas_item(canvas, "legend", "text", (width-10, 10), text=legend, anchor="ne", fill=fg,
+                    font=("Arial", 8, "italic"))
 
-    canvas.create_line(left, top, left, top+usable_h, fill=fg)
-    canvas.create_line(left, top+usable_h, left+usable_w, top+usable_h, fill=fg)
+    canvas_item(canvas, "y_axis", "line", (left, top, left, top+usable_h), fill=fg)
+    canvas_item(canvas, "x_axis", "line", (left, top+usable_h, left+usable_w, top+usable_h), fill=fg)
 
-    canvas.create_text(left-5, top, text=axis_fmt(vmax), anchor="e", fill=fg, font=("Arial", 8))
-    canvas.create_text(left-5, top+usable_h, text=axis_fmt(vmin), anchor="e", fill=fg, font=("Arial", 8))
+    canvas_item(canvas, "vmax", "text", (left-5, top), text=vmax_label, anchor="e", fill=fg,
+                font=("Arial", 8))
+    canvas_item(canvas, "vmin", "text", (left-5, top+usable_h), text=axis_fmt(vmin), anchor="e", fill=fg,
+                font=("Arial", 8))
 
-    n = len(xs)
-    x_step = usable_w / (n-1)
-    points = []
-    for i, v in enumerate(ys):
-        x = left + i * x_step
-        norm = (v - vmin) / (vmax - vmin)
-        y = top + (1-norm)*usable_h
-        points.append((x, y))
-
-    flat = []
-    for x, y in points:
-        flat.extend([x, y])
-    canvas.create_line(*flat, fill=line_color, width=2, smooth=True)
-
-    for i, (x, y) in enumerate(points):
+    flat = project_points(ys, left, top + usable_h, usable_w, usable_h, vmin, vmax)
+    canvas_item(canvas, "line", "line", tuple(flat), fill=line_color, width=2, smooth=True)
+
+    for i, (x, y) in enumerate(zip(flat[0::2], flat[1::2])):
         v = ys[i]
-        canvas.create_oval(x-2, y-2, x+2, y+2, fill=line_color, outline=line_color)
+        canvas_item(canvas, ("dot", i), "oval", (x-2, y-2, x+2, y+2), fill=line_color, outline=line_color)
         if i % 3 == 0 or i == n-1:
-            canvas.create_text(x, y-8, text=point_fmt(v), fill=fg, font=("Arial", 7), anchor="s")
-            t_str = xs[i]
-            hhmm = t_str.split("T")[1][:5] if "T" in t_str else t_str
-            canvas.create_text(x, height-bottom+3, text=hhmm, fill=fg, font=("Arial", 7), anchor="n")
+            canvas_item(canvas, ("value", i), "text", (x, y-8), text=point_fmt(v), fill=fg,
+                        font=("Arial", 7), anchor="s")
+            canvas_item(canvas, ("hour", i), "text", (x, height-bottom+3), text=xs[i], fill=fg,
+                        font=("Arial", 7), anchor="n")
 
 
 def redraw_hourly_graphs(forecast: Dict[str, Any]) -> None:
-    hourly = forecast.get("hourly") or {}
-    times = hourly.get("time") or []
-    temps = hourly.get("temperature_2m") or []
-    feels = hourly.get("apparent_temperature") or []
-    rain_probs = hourly.get("precipitation_probability") or []
-    uv_vals = hourly.get("uv_index") or []
-    wind_vals = hourly.get("wind_speed_10m") or []
-    hum_vals = hourly.get("relative_humidity_2m") or []
+    view = forecast_view(forecast)
+    rain_probs = view["h_rain_prob"]
+    uv_vals = view["h_uv"]
+    hum_vals = view["h_hum"]
 
+    # All graphs share the day's x axis, so its hour labels are sliced once.
     day = daily_dates[selected_day_index] if daily_dates and 0 <= selected_day_index < len(daily_dates) else None
+    start, end = day_slice(forecast, day) if isinstance(day, str) else (0, 0)
+    day_hours = view["h_hhmm"][start:end]
 
-    comfort_vals: List[Optional[float]] = []
-    for t, temp, hum, wind, uv, rain_p in zip(times, temps, hum_vals, wind_vals, uv_vals, rain_probs):
-        if isinstance(temp, (int, float)):
-            comfort_vals.append(compute_comfort_index(
-                float(temp),
-                float(hum) if isinstance(hum, (int, float)) else None,
-                float(wind) if isinstance(wind, (int, float)) else None,
-                float(uv) if isinstance(uv, (int, float)) else None,
-                float(rain_p) if isinstance(rain_p, (int, float)) else None,
-            ))
-        else:
-            comfort_vals.append(None)
-
-    temp_unit = "°C" if units_mode == "metric" else "°F"
-    wind_unit = "km/h" if units_mode == "metric" else "mph"
+    disp = display_arrays(forecast)
 
     draw_hourly_graph(
-        hourly_temp_canvas, times, temps, day,
+        hourly_temp_canvas, day_hours, disp["hourly_temp"][start:end],
         "24 hours – temperature",
         axis_fmt=temp_axis_label,
         point_fmt=temp_point_label,
-        legend=f"Line = temperature ({temp_unit})",
+        legend=f"Line = temperature ({temp_unit()})",
     )
     draw_hourly_graph(
-        hourly_feels_canvas, times, feels, day,
+        hourly_feels_canvas, day_hours, disp["hourly_feels"][start:end],
         "24 hours – feels like",
         axis_fmt=temp_axis_label,
         point_fmt=temp_point_label,
-        legend=f"Line = feels-like ({temp_unit})",
+        legend=f"Line = feels-like ({temp_unit()})",
     )
     draw_hourly_graph(
-        hourly_rain_canvas, times, rain_probs, day,
+        hourly_rain_canvas, day_hours, rain_probs[start:end],
         "24 hours – rain chance",
         axis_fmt=lambda v: f"{v:.0f}%",
         point_fmt=lambda v: f"{v:.0f}%",
         legend="Line = rain probability (%)",
     )
     draw_hourly_graph(
-        hourly_uv_canvas, times, uv_vals, day,
+        hourly_uv_canvas, day_hours, uv_vals[start:end],
         "24 hours – UV index",
         axis_fmt=lambda v: f"{v:.1f}",
         point_fmt=lambda v: f"{v:.1f}",
         legend="Line = UV index",
     )
     draw_hourly_graph(
-        hourly_wind_canvas, times, wind_vals, day,
+        hourly_wind_canvas, day_hours, disp["hourly_wind"][start:end],
         "24 hours – wind speed",
         axis_fmt=wind_axis_label,
         point_fmt=wind_point_label,
-        legend=f"Line = wind speed ({wind_unit})",
+        legend=f"Line = wind speed ({wind_unit()})",
     )
     draw_hourly_graph(
-        hourly_humid_canvas, times, hum_vals, day,
+        hourly_humid_canvas, day_hours, hum_vals[start:end],
         "24 hours – humidity",
         axis_fmt=lambda v: f"{v:.0f}%",
         point_fmt=lambda v: f"{v:.0f}%",
@@ -1633,27 +2346,61 @@ def redraw_hourly_graphs(forecast: Dict[str, Any]) -> None:
 
     if show_comfort_graph:
         draw_hourly_graph(
-            hourly_comfort_canvas, times, comfort_vals, day,
+            hourly_comfort_canvas, day_hours, comfort_series(forecast)[start:end],
             "24 hours – comfort index",
             axis_fmt=lambda v: f"{v:.0f}/100",
             point_fmt=lambda v: f"{v:.0f}/100",
             legend="Line = comfort (0 awful – 100 perfect)",
         )
     else:
-        hourly_comfort_canvas.delete("all")
+        blank_canvas(hourly_comfort_canvas)
 
 
 # ===========================
 # HOURLY MINI-STRIP + BEST HOUR
 # ===========================
 
+# Overcast/fog codes (3, 45, 48) as bits, so the per-hour test is one shift.
+_FOG_MASK = (1 << 3) | (1 << 45) | (1 << 48)
+
+
+def outdoor_score(temp_c: float, rain_p: float, wind_kmh: float, code_i: int) -> float:
+    """
+    0-100ish "nice to be outside" score for one hour, from already
+    cleaned scalars (missing rain/wind count as 0, missing code as 0).
+    """
+    score = 100.0
+
+    if rain_p >= 70 or code_i >= 95:
+        score -= 70
+    elif rain_p >= 40:
+        score -= 40
+    elif rain_p >= 20:
+        score -= 15
+
+    ideal = 19.0
+    score -= min(50, abs(temp_c - ideal) * 2.5)
+
+    if wind_kmh > 50:
+        score -= 30
+    elif wind_kmh > 35:
+        score -= 15
+    elif wind_kmh > 25:
+        score -= 5
+
+    if code_i >= 0 and (_FOG_MASK >> code_i) & 1:
+        score -= 5
+
+    return score
+
+
 def find_best_hour_for_outdoor(forecast: Dict[str, Any]) -> Optional[str]:
-    hourly = forecast.get("hourly") or {}
-    times = hourly.get("time") or []
-    temps = hourly.get("temperature_2m") or []
-    rain_probs = hourly.get("precipitation_probability") or []
-    wind_vals = hourly.get("wind_speed_10m") or []
-    codes = hourly.get("weather_code") or []
+    view = forecast_view(forecast)
+    times = view["hourly_times"]
+    temps = view["h_temp"]
+    rain_probs = view["h_rain_prob"]
+    wind_vals = view["h_wind"]
+    codes = view["h_code"]
 
     current = forecast.get("current") or {}
     now_time = current.get("time")
@@ -1661,42 +2408,26 @@ def find_best_hour_for_outdoor(forecast: Dict[str, Any]) -> Optional[str]:
         return None
     today = now_time.split("T")[0]
 
+    # Only today's ~24 hours are scored; day_slice() finds them with a bisect
+    # instead of testing every hour of the 12-day forecast.
+    start, end = day_slice(forecast, today)
+
     best_score = -1.0
     best_t = None
 
-    for t, temp, rain, wind, code in zip(times, temps, rain_probs, wind_vals, codes):
-        if not isinstance(t, str) or not t.startswith(today):
+    # The view columns are already numeric-or-None, so a None test is the
+    # only validation left per hour.
+    for t, temp, rain, wind, code in zip(times[start:end], temps[start:end], rain_probs[start:end],
+                                         wind_vals[start:end], codes[start:end]):
+        if temp is None or not isinstance(t, str) or not t.startswith(today):
             continue
-        if not isinstance(temp, (int, float)):
-            continue
-
-        temp_c = float(temp)
-        rain_p = float(rain) if isinstance(rain, (int, float)) else 0.0
-        wind_kmh = float(wind) if isinstance(wind, (int, float)) else 0.0
-        code_i = int(code) if isinstance(code, (int, float)) else 0
-
-        score = 100.0
-
-        if rain_p >= 70 or code_i >= 95:
-            score -= 70
-        elif rain_p >= 40:
-            score -= 40
-        elif rain_p >= 20:
-            score -= 15
-
-        ideal = 19.0
-        score -= min(50, abs(temp_c - ideal) * 2.5)
-
-        if wind_kmh > 50:
-            score -= 30
-        elif wind_kmh > 35:
-            score -= 15
-        elif wind_kmh > 25:
-            score -= 5
-
-        if code_i in (3, 45, 48):
-            score -= 5
 
+        score = outdoor_score(
+            float(temp),
+            float(rain) if rain is not None else 0.0,
+            float(wind) if wind is not None else 0.0,
+            int(code) if code is not None else 0,
+        )
         if score > best_score:
             best_score = score
             best_t = t
@@ -1706,31 +2437,43 @@ def find_best_hour_for_outdoor(forecast: Dict[str, Any]) -> Optional[str]:
     return best_t
 
 
+STRIP_FONT = ("Arial", 8)
+STRIP_RAIN_FONT = ("Arial", 7)
+STRIP_ICON_FONT = ("Segoe UI Emoji", 14)
+
+
 def draw_hourly_strip(forecast: Dict[str, Any]) -> None:
-    hourly = forecast.get("hourly") or {}
-    times = hourly.get("time") or []
-    temps = hourly.get("temperature_2m") or []
-    rain_probs = hourly.get("precipitation_probability") or []
-    codes = hourly.get("weather_code") or []
+    view = forecast_view(forecast)
+    times = view["hourly_times"]
+    temps = display_arrays(forecast)["hourly_temp"]
+    rain_probs = view["h_rain_prob"]
+    h_icons = view["h_icons"]
 
-    hourly_strip_canvas.delete("all")
+    c = hourly_strip_canvas
     day = daily_dates[selected_day_index] if daily_dates and 0 <= selected_day_index < len(daily_dates) else None
     if not isinstance(day, str) or not times:
+        blank_canvas(c)
         return
 
-    xs: List[str] = []
-    temp_vals: List[float] = []
-    rain_vals: List[float] = []
-    code_vals: List[int] = []
-
-    for t, temp, rain_p, code in zip(times, temps, rain_probs, codes):
-        if isinstance(t, str) and t.startswith(day) and isinstance(temp, (int, float)):
-            xs.append(t)
-            temp_vals.append(float(temp))
-            rain_vals.append(float(rain_p) if isinstance(rain_p, (int, float)) else 0.0)
-            code_vals.append(int(code) if isinstance(code, (int, float)) else 0)
+    # The day's columns are plain slices of the view; hours are only picked
+    # out one by one when some lack a temperature (or times are unsorted).
+    start, end = day_slice(forecast, day)
+    xs = times[start:end]
+    temp_vals = temps[start:end]
+    rain_vals = [float(r) if r is not None else 0.0 for r in rain_probs[start:end]]
+    icon_vals = h_icons[start:end]
+    hhmm_vals = view["h_hhmm"][start:end]
+    if not view["hourly_sorted"] or None in temp_vals:
+        keep = [i for i, (t, v) in enumerate(zip(xs, temp_vals))
+                if v is not None and isinstance(t, str) and t.startswith(day)]
+        xs = [xs[i] for i in keep]
+        temp_vals = [temp_vals[i] for i in keep]
+        rain_vals = [rain_vals[i] for i in keep]
+        icon_vals = [icon_vals[i] for i in keep]
+        hhmm_vals = [hhmm_vals[i] for i in keep]
 
     if not xs:
+        blank_canvas(c)
         return
 
     col_width = 70
@@ -1738,95 +2481,66 @@ def draw_hourly_strip(forecast: Dict[str, Any]) -> None:
     margin = 10
     total_width = margin + len(xs)*col_width
 
-    hourly_strip_canvas.config(scrollregion=(0, 0, total_width, height))
+    c.config(scrollregion=(0, 0, total_width, height))
 
     theme = THEMES[theme_mode]
     fg = theme["fg"]
     accent = theme["accent"]
 
-    best_day_prefix = None
-    if best_hour_time and "T" in best_hour_time:
-        best_day_prefix = best_hour_time.split("T")[0]
-
-    for i, t in enumerate(xs):
-        x0 = margin + i*col_width
-        x1 = x0 + col_width
-        x_center = x0 + col_width/2
-        hhmm = t.split("T")[1][:5] if "T" in t else t
-
-        temp_c = temp_vals[i]
-        temp_label = temp_point_label(temp_c)
-        rain_p = rain_vals[i]
-        code = code_vals[i]
-
-        if best_hour_time and t == best_hour_time and day == best_day_prefix:
-            hourly_strip_canvas.create_rectangle(
-                x0+2, 5, x1-2, height-5,
-                outline=accent, width=2
-            )
+    best_idx = None
+    if best_hour_time and "T" in best_hour_time and day == best_hour_time.split("T")[0] and best_hour_time in xs:
+        best_idx = xs.index(best_hour_time)
+
+    # Same hour count keeps the same four texts per column; a redraw (day
+    # click, theme or units toggle) only pushes the texts/colours that changed.
+    begin_canvas_items(c, (len(xs), best_idx is not None))
+
+    if best_idx is not None:
+        x0 = margin + best_idx*col_width
+        canvas_item(c, "best", "rectangle", (x0+2, 5, x0+col_width-2, height-5), outline=accent, width=2)
+
+    # Shared text options, built once per redraw rather than per item.
+    small_kw = {"anchor": "n", "fill": fg, "font": STRIP_FONT}
+    rain_kw = {"anchor": "n", "fill": fg, "font": STRIP_RAIN_FONT}
+    icon_kw = {"anchor": "n", "font": STRIP_ICON_FONT}
+
+    for i, hhmm in enumerate(hhmm_vals):
+        x_center = margin + i*col_width + col_width/2
 
-        hourly_strip_canvas.create_text(x_center, 10, text=hhmm, anchor="n", fill=fg, font=("Arial", 8))
-        hourly_strip_canvas.create_text(x_center, 26, text=weather_icon(code), anchor="n",
-                                        font=("Segoe UI Emoji", 14))
-        hourly_strip_canvas.create_text(x_center, 48, text=temp_label, anchor="n", fill=fg, font=("Arial", 8))
-        hourly_strip_canvas.create_text(x_center, 68, text=f"{rain_p:.0f}%", anchor="n", fill=fg, font=("Arial", 7))
+        canvas_item(c, ("time", i), "text", (x_center, 10), text=hhmm, **small_kw)
+        canvas_item(c, ("icon", i), "text", (x_center, 26), text=icon_vals[i], **icon_kw)
+        canvas_item(c, ("temp", i), "text", (x_center, 48), text=temp_point_label(temp_vals[i]), **small_kw)
+        canvas_item(c, ("rain", i), "text", (x_center, 68), text=f"{rain_vals[i]:.0f}%", **rain_kw)
 
 
 # ===========================
 # DAILY TEXT
 # ===========================
 
+@per_forecast_text
 def build_daily_text(forecast: Dict[str, Any]) -> str:
-    daily = forecast.get("daily") or {}
-    hourly = forecast.get("hourly") or {}
+    view = forecast_view(forecast)
 
-    dates = daily.get("time") or []
-    tmax = daily.get("temperature_2m_max") or []
-    tmin = daily.get("temperature_2m_min") or []
-    app_max = daily.get("apparent_temperature_max") or []
-    app_min = daily.get("apparent_temperature_min") or []
-    uvmax = daily.get("uv_index_max") or []
-    rain_sum = daily.get("precipitation_sum") or []
-    rain_prob = daily.get("precipitation_probability_max") or []
-    wind_max = daily.get("wind_speed_10m_max") or []
-    codes = daily.get("weather_code") or []
-    sunrise = daily.get("sunrise") or []
-    sunset = daily.get("sunset") or []
+    lines: List[str] = []
 
-    h_times = hourly.get("time") or []
-    h_hum = hourly.get("relative_humidity_2m") or []
+    for i in range(view["n_days"]):
+        day_label = view["day_labels"][i]
 
-    lines: List[str] = []
-    n = min(FORECAST_DAYS, len(dates))
+        tmax_i = view["tmax"][i]
+        tmin_i = view["tmin"][i]
+        app_max_i = view["app_max"][i]
+        app_min_i = view["app_min"][i]
+        uv_i = view["uv"][i]
+        rain_i = view["rain"][i]
+        prob_i = view["rain_prob"][i]
+        wind_i = view["wind"][i]
 
-    for i in range(n):
-        date_str = dates[i]
-        try:
-            dt = datetime.fromisoformat(date_str)
-            day_label = dt.strftime("%a %d %b")
-        except Exception:
-            day_label = date_str
-
-        code = codes[i] if i < len(codes) else None
-        tmax_i = tmax[i] if i < len(tmax) else None
-        tmin_i = tmin[i] if i < len(tmin) else None
-        app_max_i = app_max[i] if i < len(app_max) else None
-        app_min_i = app_min[i] if i < len(app_min) else None
-        uv_i = uvmax[i] if i < len(uvmax) else None
-        rain_i = rain_sum[i] if i < len(rain_sum) else None
-        prob_i = rain_prob[i] if i < len(rain_prob) else None
-        wind_i = wind_max[i] if i < len(wind_max) else None
-
-        hum_vals = [
-            h for t, h in zip(h_times, h_hum)
-            if isinstance(t, str) and t.startswith(date_str) and isinstance(h, (int, float))
-        ]
-        hum_avg = sum(hum_vals)/len(hum_vals) if hum_vals else None
+        hum_avg = view["daily_hum"][i]
 
-        sr = sunrise[i].split("T")[1] if i < len(sunrise) and isinstance(sunrise[i], str) else "N/A"
-        ss = sunset[i].split("T")[1] if i < len(sunset) and isinstance(sunset[i], str) else "N/A"
+        sr = view["sunrise"][i].split("T")[1] if view["sunrise"][i] else "N/A"
+        ss = view["sunset"][i].split("T")[1] if view["sunset"][i] else "N/A"
 
-        lines.append(f"{day_label}: {weather_icon(code)} {weather_text(code)}")
+        lines.append(f"{day_label}: {view['d_icons'][i]} {view['d_texts'][i]}")
         lines.append(f"  Max temp:    {fmt_temp_value(tmax_i)}")
         lines.append(f"  Min temp:    {fmt_temp_value(tmin_i)}")
         lines.append(f"  Feels max:   {fmt_temp_value(app_max_i)}")
@@ -1836,7 +2550,7 @@ def build_daily_text(forecast: Dict[str, Any]) -> str:
         if uv_i is not None:
             lines.append(f"  UV max:      {uv_i:.1f} ({interpret_uv(uv_i)})")
         if rain_i is not None:
-            extra = f" (chance {prob_i:.0f}%)" if isinstance(prob_i, (int, float)) else ""
+            extra = f" (chance {prob_i:.0f}%)" if prob_i is not None else ""
             lines.append(f"  Rain:        {fmt_rain_value(rain_i)}{extra}")
         if wind_i is not None:
             lines.append(f"  Max wind:    {fmt_wind_value(wind_i)}")
@@ -1850,57 +2564,37 @@ def build_daily_text(forecast: Dict[str, Any]) -> str:
 # 12-DAY OVERVIEW & EXTREMES
 # ===========================
 
+@per_forecast_text
 def generate_12day_overview(forecast: Dict[str, Any]) -> str:
-    daily = forecast.get("daily") or {}
-    dates = daily.get("time") or []
-    tmax = daily.get("temperature_2m_max") or []
-    tmin = daily.get("temperature_2m_min") or []
-    rain_sum = daily.get("precipitation_sum") or []
-    wind_max = daily.get("wind_speed_10m_max") or []
-    codes = daily.get("weather_code") or []
-
-    n = min(FORECAST_DAYS, len(dates))
+    view = forecast_view(forecast)
+    n = view["n_days"]
     if n == 0:
         return "No forecast available."
 
-    days: List[Dict[str, Any]] = []
-    for i in range(n):
-        date_str = dates[i]
-        try:
-            dt = datetime.fromisoformat(date_str)
-            label = dt.strftime("%a %d %b")
-        except Exception:
-            dt = None
-            label = date_str
-        days.append({
-            "index": i,
-            "date": date_str,
-            "label": label,
-            "dt": dt,
-            "tmax": tmax[i] if i < len(tmax) else None,
-            "tmin": tmin[i] if i < len(tmin) else None,
-            "rain": rain_sum[i] if i < len(rain_sum) else None,
-            "wind": wind_max[i] if i < len(wind_max) else None,
-            "code": codes[i] if i < len(codes) else None,
-        })
+    labels = view["day_labels"]
+
+    high_vals = [v for v in view["tmax"] if v is not None]
+    low_vals = [v for v in view["tmin"] if v is not None]
+    rain_vals = [v for v in view["rain"] if v is not None]
+    wind_vals = [v for v in view["wind"] if v is not None]
 
-    high_vals = [d["tmax"] for d in days if isinstance(d["tmax"], (int, float))]
-    low_vals = [d["tmin"] for d in days if isinstance(d["tmin"], (int, float))]
-    rain_vals = [d["rain"] for d in days if isinstance(d["rain"], (int, float))]
-    wind_vals = [d["wind"] for d in days if isinstance(d["wind"], (int, float))]
+    # Every statistic is reduced once (C-level builtins) and shared by the
+    # range, trend, notable-days and headline lines below.
+    overall_high = max(high_vals) if high_vals else None
+    overall_low = min(low_vals) if low_vals else None
+    total_rain = sum(rain_vals)
+    wettest = max(rain_vals) if rain_vals else None
+    windiest = max(wind_vals) if wind_vals else None
+    avg_high = sum(high_vals)/len(high_vals) if high_vals else None
 
     lines: List[str] = []
     lines.append(f"{FORECAST_DAYS}-day overview:")
 
     if high_vals and low_vals:
-        overall_high = max(high_vals)
-        overall_low = min(low_vals)
         lines.append(f"• Temperatures range roughly from {fmt_temp_value(overall_low)} to {fmt_temp_value(overall_high)}.")
     elif high_vals:
-        overall_high = max(high_vals)
         lines.append(f"• Highs up to about {fmt_temp_value(overall_high)}.")
     elif low_vals:
-        overall_low = min(low_vals)
         lines.append(f"• Lows down to about {fmt_temp_value(overall_low)}.")
     else:
         lines.append("• Temperature range: N/A.")
@@ -1923,7 +2617,6 @@ def generate_12day_overview(forecast: Dict[str, Any]) -> str:
         lines.append("• Trend: not enough data to judge.")
 
     if rain_vals:
-        total_rain = sum(rain_vals)
         if total_rain < 2:
             rain_line = "mostly dry, only small amounts of rain expected."
         elif total_rain < 10:
@@ -1937,22 +2630,17 @@ def generate_12day_overview(forecast: Dict[str, Any]) -> str:
     lines.append("")
     lines.append("Notable days:")
 
-    warmest_day = max(days, key=lambda d: d["tmax"] if isinstance(d["tmax"], (int, float)) else -999)
-    coldest_day = min(days, key=lambda d: d["tmin"] if isinstance(d["tmin"], (int, float)) else 999)
-    wettest_day = max(days, key=lambda d: d["rain"] if isinstance(d["rain"], (int, float)) else -1)
-    windiest_day = max(days, key=lambda d: d["wind"] if isinstance(d["wind"], (int, float)) else -1)
-
-    if isinstance(warmest_day["tmax"], (int, float)):
-        lines.append(f"• Warmest: {warmest_day['label']} – {fmt_temp_value(warmest_day['tmax'])}.")
-    if isinstance(coldest_day["tmin"], (int, float)):
-        lines.append(f"• Coldest: {coldest_day['label']} – {fmt_temp_value(coldest_day['tmin'])}.")
-    if isinstance(wettest_day["rain"], (int, float)):
-        lines.append(f"• Wettest: {wettest_day['label']} – {fmt_rain_value(wettest_day['rain'])}.")
-    if isinstance(windiest_day["wind"], (int, float)):
-        lines.append(f"• Windiest: {windiest_day['label']} – gusts up to {fmt_wind_value(windiest_day['wind'])}.")
+    # list.index() finds each extreme's (first) day; no per-day key callbacks.
+    if high_vals:
+        lines.append(f"• Warmest: {labels[view['tmax'].index(overall_high)]} – {fmt_temp_value(overall_high)}.")
+    if low_vals:
+        lines.append(f"• Coldest: {labels[view['tmin'].index(overall_low)]} – {fmt_temp_value(overall_low)}.")
+    if rain_vals:
+        lines.append(f"• Wettest: {labels[view['rain'].index(wettest)]} – {fmt_rain_value(wettest)}.")
+    if wind_vals:
+        lines.append(f"• Windiest: {labels[view['wind'].index(windiest)]} – gusts up to {fmt_wind_value(windiest)}.")
 
     lines.append("")
-    avg_high = sum(high_vals)/len(high_vals) if high_vals else None
     if avg_high is not None:
         if avg_high <= 5:
             temp_word = "mostly cold"
@@ -1967,8 +2655,8 @@ def generate_12day_overview(forecast: Dict[str, Any]) -> str:
     else:
         temp_word = "mixed"
 
-    rain_word = "with several wet days." if rain_vals and sum(rain_vals) > 8 else \
-                "with occasional showers." if rain_vals and sum(rain_vals) > 2 else \
+    rain_word = "with several wet days." if rain_vals and total_rain > 8 else \
+                "with occasional showers." if rain_vals and total_rain > 2 else \
                 "and often dry."
 
     lines.append(f"Headline: The next {FORECAST_DAYS} days look {temp_word} {rain_word}")
@@ -1980,9 +2668,9 @@ def generate_12day_overview(forecast: Dict[str, Any]) -> str:
 # WEATHER STORY CARD (unchanged)
 # ===========================
 
+@per_forecast_text
 def generate_story_text(forecast: Dict[str, Any]) -> str:
     daily = forecast.get("daily") or {}
-    hourly = forecast.get("hourly") or {}
     current = forecast.get("current") or {}
 
     dates = daily.get("time") or []
@@ -1992,10 +2680,11 @@ def generate_story_text(forecast: Dict[str, Any]) -> str:
     uvmax = daily.get("uv_index_max") or []
     rain_prob_max = daily.get("precipitation_probability_max") or []
 
-    h_times = hourly.get("time") or []
-    h_temps = hourly.get("temperature_2m") or []
-    h_rain = hourly.get("precipitation_probability") or []
-    h_codes = hourly.get("weather_code") or []
+    view = forecast_view(forecast)
+    h_times = view["hourly_times"]
+    h_temps = view["h_temp"]
+    h_rain = view["h_rain_prob"]
+    h_codes = view["h_code"]
 
     now_str = current.get("time")
     today = None
@@ -2006,22 +2695,23 @@ def generate_story_text(forecast: Dict[str, Any]) -> str:
 
     lines: List[str] = []
 
-    def slice_hours(start_h: int, end_h: int):
-        temps, rains, codes_ = [], [], []
-        for t, temp, r, c in zip(h_times, h_temps, h_rain, h_codes):
-            if not isinstance(t, str) or not isinstance(temp, (int, float)):
-                continue
-            if not today or not t.startswith(today):
+    # Today's hours are bucketed in one pass over day_slice(): morning (6-12),
+    # afternoon (12-18) and evening (18-24), as (temps, rains, codes) lists.
+    periods: List[Tuple[List[float], List[float], List[int]]] = [([], [], []) for _ in range(3)]
+    if isinstance(today, str):
+        start, end = day_slice(forecast, today)
+        for t, temp, r, c in zip(h_times[start:end], h_temps[start:end], h_rain[start:end], h_codes[start:end]):
+            if not isinstance(t, str) or temp is None or not t.startswith(today):
                 continue
             hh = int(t.split("T")[1][:2])
-            if start_h <= hh < end_h:
+            if 6 <= hh < 24:
+                temps, rains, codes_ = periods[(hh - 6) // 6]
                 temps.append(float(temp))
-                rains.append(float(r) if isinstance(r, (int, float)) else 0.0)
-                codes_.append(int(c) if isinstance(c, (int, float)) else 0)
-        return temps, rains, codes_
+                rains.append(float(r) if r is not None else 0.0)
+                codes_.append(int(c) if c is not None else 0)
 
-    def describe_period(name: str, start_h: int, end_h: int):
-        temps, rains, codes_ = slice_hours(start_h, end_h)
+    def describe_period(name: str, period: int):
+        temps, rains, codes_ = periods[period]
         if not temps:
             return f"{name}: No data.\n"
 
@@ -2053,13 +2743,13 @@ def generate_story_text(forecast: Dict[str, Any]) -> str:
         if common_code is not None:
             desc_parts.append(f"({weather_text(common_code).lower()})")
 
-        return f"{name}: {' '.join(desc_parts)}, around {temp_point_label(avg_temp)}.\n"
+        return f"{name}: {' '.join(desc_parts)}, around {temp_point_label(to_display_temp(avg_temp))}.\n"
 
     lines.append("Today’s story:")
     if today:
-        lines.append(describe_period("Morning", 6, 12).strip())
-        lines.append(describe_period("Afternoon", 12, 18).strip())
-        lines.append(describe_period("Evening", 18, 24).strip())
+        lines.append(describe_period("Morning", 0).strip())
+        lines.append(describe_period("Afternoon", 1).strip())
+        lines.append(describe_period("Evening", 2).strip())
     else:
         lines.append("No hourly data to build today’s story.")
 
@@ -2069,11 +2759,7 @@ def generate_story_text(forecast: Dict[str, Any]) -> str:
     if n >= 2:
         for i in range(n):
             date_str = dates[i]
-            try:
-                dt = datetime.fromisoformat(date_str)
-                day_label = dt.strftime("%a")
-            except Exception:
-                day_label = date_str
+            day_label = weekday_label(date_str)
             code = codes[i] if i < len(codes) else None
             tmax_i = tmax[i] if i < len(tmax) else None
             tmin_i = tmin[i] if i < len(tmin) else None
@@ -2111,21 +2797,15 @@ def generate_story_text(forecast: Dict[str, Any]) -> str:
 
 def draw_sunrise_card(forecast: Dict[str, Any]) -> None:
     sun_canvas.delete("all")
-    daily = forecast.get("daily") or {}
     current = forecast.get("current") or {}
 
-    sunrise_list = daily.get("sunrise") or []
-    sunset_list = daily.get("sunset") or []
-    if not sunrise_list or not sunset_list:
+    sun_day = forecast_view(forecast)["sun_day"]
+    if sun_day is None:
         sun_text_label.config(text="No sunrise/sunset data.")
         return
 
-    sunrise_str = sunrise_list[0]
-    sunset_str = sunset_list[0]
-    try:
-        sunrise_dt = datetime.fromisoformat(sunrise_str)
-        sunset_dt = datetime.fromisoformat(sunset_str)
-    except Exception:
+    sunrise_str, sunset_str, sunrise_dt, sunset_dt = sun_day
+    if sunrise_dt is None:
         sun_text_label.config(text="Sunrise/sunset time format error.")
         return
 
@@ -2167,6 +2847,20 @@ def draw_sunrise_card(forecast: Dict[str, Any]) -> None:
 # WIND CARD
 # ===========================
 
+# Arrow direction (cos, sin) for every whole degree, 0° pointing up the
+# compass. Open-Meteo reports integer degrees, so redraws are a lookup.
+WIND_ARROW_UNIT = tuple(
+    (math.cos(math.radians(d - 90)), math.sin(math.radians(d - 90))) for d in range(360)
+)
+
+
+def wind_arrow_unit(wind_dir: float) -> Tuple[float, float]:
+    if 0 <= wind_dir < 360 and int(wind_dir) == wind_dir:
+        return WIND_ARROW_UNIT[int(wind_dir)]
+    angle_rad = math.radians(wind_dir - 90)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
 def draw_wind_card(forecast: Dict[str, Any]) -> None:
     wind_canvas.delete("all")
     current = forecast.get("current") or {}
@@ -2215,10 +2909,9 @@ def draw_wind_card(forecast: Dict[str, Any]) -> None:
     wind_canvas.create_text(cx-r-8, cy, text="W", fill=fg, font=("Arial", 9))
 
     if isinstance(wind_dir, (int, float)):
-        angle_deg = wind_dir - 90
-        angle_rad = math.radians(angle_deg)
-        x_end = cx + r * math.cos(angle_rad)
-        y_end = cy + r * math.sin(angle_rad)
+        ux, uy = wind_arrow_unit(wind_dir)
+        x_end = cx + r * ux
+        y_end = cy + r * uy
         wind_canvas.create_line(cx, cy, x_end, y_end, fill=accent, width=3, arrow=tk.LAST)
 
 
@@ -2259,41 +2952,35 @@ def draw_air_card(air: Optional[Dict[str, Any]]) -> None:
 # MOON PHASE CARD
 # ===========================
 
+# Phase boundaries as fractions of the synodic month; bisect_right picks the
+# phase. The last limit is the float just above 0.97 so that 0.97 itself is
+# still a waning crescent and only values past it wrap to new moon.
+MOON_LIMITS = (0.03, 0.22, 0.28, 0.47, 0.53, 0.72, 0.78, math.nextafter(0.97, 1.0))
+MOON_PHASES = (
+    ("🌑", "New moon"),
+    ("🌒", "Waxing crescent"),
+    ("🌓", "First quarter"),
+    ("🌔", "Waxing gibbous"),
+    ("🌕", "Full moon"),
+    ("🌖", "Waning gibbous"),
+    ("🌗", "Last quarter"),
+    ("🌘", "Waning crescent"),
+    ("🌑", "New moon"),
+)
+MOON_KNOWN_NEW = datetime(2000, 1, 6).toordinal()
+MOON_SYNODIC = 29.53058867
+
+
 def moon_phase_info(date: datetime) -> (str, str):
-    known_new = datetime(2000, 1, 6)
-    days = (date - known_new).total_seconds() / 86400.0
-    synodic = 29.53058867
-    phase = days % synodic
-    frac = phase / synodic
-
-    if frac < 0.03 or frac > 0.97:
-        return "🌑", "New moon"
-    elif frac < 0.22:
-        return "🌒", "Waxing crescent"
-    elif frac < 0.28:
-        return "🌓", "First quarter"
-    elif frac < 0.47:
-        return "🌔", "Waxing gibbous"
-    elif frac < 0.53:
-        return "🌕", "Full moon"
-    elif frac < 0.72:
-        return "🌖", "Waning gibbous"
-    elif frac < 0.78:
-        return "🌗", "Last quarter"
-    else:
-        return "🌘", "Waning crescent"
+    seconds = date.hour * 3600 + date.minute * 60 + date.second + date.microsecond / 1e6
+    days = (date.toordinal() - MOON_KNOWN_NEW) + seconds / 86400.0
+    frac = (days % MOON_SYNODIC) / MOON_SYNODIC
+    return MOON_PHASES[bisect.bisect_right(MOON_LIMITS, frac)]
 
 
 def draw_moon_card(forecast: Dict[str, Any]) -> None:
     current = forecast.get("current") or {}
-    now_str = current.get("time")
-    if isinstance(now_str, str):
-        try:
-            now_dt = datetime.fromisoformat(now_str)
-        except Exception:
-            now_dt = datetime.now()
-    else:
-        now_dt = datetime.now()
+    now_dt = parse_iso(current.get("time")) or datetime.now()
 
     emoji, desc = moon_phase_info(now_dt)
     moon_text_label.config(
@@ -2306,65 +2993,77 @@ def draw_moon_card(forecast: Dict[str, Any]) -> None:
 # ACTIVITIES CARD (NEW best hours)
 # ===========================
 
+@per_forecast_text
 def rank_activity_hours(forecast: Dict[str, Any]) -> str:
-    hourly = forecast.get("hourly") or {}
-    times = hourly.get("time") or []
-    temps = hourly.get("temperature_2m") or []
-    rain_probs = hourly.get("precipitation_probability") or []
-    uv_vals = hourly.get("uv_index") or []
-    wind_vals = hourly.get("wind_speed_10m") or []
-    codes = hourly.get("weather_code") or []
-
     current = forecast.get("current") or {}
     now_time = current.get("time")
-    if not isinstance(now_time, str):
+    hourly = forecast.get("hourly") or {}
+    # Partial payloads (no current time, hours or temperatures) bail out
+    # before any slicing or scoring.
+    if not (isinstance(now_time, str) and hourly.get("time") and hourly.get("temperature_2m")):
         return "No hourly ranking available."
     today = now_time.split("T")[0]
 
-    scored = []
-    for t, temp, rain, uv, wind, code in zip(times, temps, rain_probs, uv_vals, wind_vals, codes):
-        if not isinstance(t, str) or not t.startswith(today):
-            continue
-        if not isinstance(temp, (int, float)):
-            continue
-
-        comfort = compute_comfort_index(
-            float(temp),
-            None,
-            float(wind) if isinstance(wind, (int, float)) else None,
-            float(uv) if isinstance(uv, (int, float)) else None,
-            float(rain) if isinstance(rain, (int, float)) else None
-        ) or 0.0
-
-        rain_p = float(rain) if isinstance(rain, (int, float)) else 0.0
-        uv_v = float(uv) if isinstance(uv, (int, float)) else 0.0
-        wind_k = float(wind) if isinstance(wind, (int, float)) else 0.0
-        code_i = int(code) if isinstance(code, (int, float)) else 0
-
-        # Walk score: comfort heavy, rain heavy, wind moderate
-        walk_score = comfort - rain_p*0.6 - max(0, wind_k-25)*0.4
-
-        # Sport/running score: comfort + cooler bias, penalize high UV/rain
-        sport_score = comfort - rain_p*0.7 - max(0, uv_v-5)*4
-
-        # Stargazing: prefer clear/mostly clear, low rain, evening/night hours
-        hh = int(t.split("T")[1][:2])
-        sky_bonus = 20 if code_i in (0, 1) else 5 if code_i in (2,) else -10
-        night_bonus = 15 if (hh >= 19 or hh <= 5) else 0
-        star_score = sky_bonus + night_bonus - rain_p*0.8
-
-        scored.append((t, walk_score, sport_score, star_score))
-
-    if not scored:
+    # Today's hours, as slices of the view's numeric-or-None columns. With
+    # sorted times the bisected slice is exactly today, so hours only need
+    # checking one by one when some lack a temperature.
+    view = forecast_view(forecast)
+    start, end = day_slice(forecast, today)
+    if view["hourly_sorted"] and None not in view["h_temp"][start:end]:
+        keep = range(start, end)
+    else:
+        keep = [i for i in range(start, end)
+                if view["h_temp"][i] is not None
+                and isinstance(view["hourly_times"][i], str) and view["hourly_times"][i].startswith(today)]
+    if not keep:
         return "No hourly ranking available."
 
-    def top3(idx):
-        best = sorted(scored, key=lambda x: x[idx], reverse=True)[:3]
-        return [b[0].split("T")[1][:5] for b in best]
+    def column(key: str) -> List[Optional[float]]:
+        values = view[key]
+        if isinstance(keep, range):
+            return values[start:end]
+        return [values[i] for i in keep]
+
+    times = column("hourly_times")
+    temps = column("h_temp")
+    rains = column("h_rain_prob")
+    uvs = column("h_uv")
+    winds = column("h_wind")
+
+    # Each score is one expression over the whole column; missing values
+    # count as 0 (and humidity is left out of the comfort part).
+    comforts = compute_comfort_series(temps, [None] * len(keep), winds, uvs, rains)
+    rain_ps = [float(r) if r is not None else 0.0 for r in rains]
+    uv_vs = [float(u) if u is not None else 0.0 for u in uvs]
+    wind_ks = [float(w) if w is not None else 0.0 for w in winds]
+    code_is = [int(cd) if cd is not None else 0 for cd in column("h_code")]
+    # "YYYY-MM-DDTHH:MM" -> "HH:MM" and the hour, by slicing rather than split().
+    hhmm = [t[11:16] for t in times]
+    hours = [int(t[11:13]) for t in times]
+
+    # Walk score: comfort heavy, rain heavy, wind moderate
+    walk_scores = [c - r*0.6 - max(0, w-25)*0.4 for c, r, w in zip(comforts, rain_ps, wind_ks)]
+
+    # Sport/running score: comfort + cooler bias, penalize high UV/rain
+    sport_scores = [c - r*0.7 - max(0, u-5)*4 for c, r, u in zip(comforts, rain_ps, uv_vs)]
+
+    # Stargazing: prefer clear/mostly clear, low rain, evening/night hours
+    star_scores = [
+        (20 if code_i in (0, 1) else 5 if code_i in (2,) else -10)
+        + (15 if (hh >= 19 or hh <= 5) else 0)
+        - r*0.8
+        for code_i, hh, r in zip(code_is, hours, rain_ps)
+    ]
+
+    def top3(scores: List[float]) -> List[str]:
+        # nlargest keeps sorted()'s tie order (earlier hour first) without
+        # sorting or copying the whole day.
+        best = heapq.nlargest(3, range(len(scores)), key=scores.__getitem__)
+        return [hhmm[i] for i in best]
 
-    walk_best = top3(1)
-    sport_best = top3(2)
-    star_best = top3(3)
+    walk_best = top3(walk_scores)
+    sport_best = top3(sport_scores)
+    star_best = top3(star_scores)
 
     return (
         "Best hours today (local time):\n"
@@ -2374,6 +3073,19 @@ def rank_activity_hours(forecast: Dict[str, Any]) -> str:
     )
 
 
+# Upper bounds (inclusive, °C) of the comfort bands; bisect_left maps a
+# temperature to its line, the last one being everything above 30.
+ACTIVITY_TEMP_BANDS = (3, 10, 24, 30)
+ACTIVITY_TEMP_LINES = (
+    "• Feels very cold – short outdoor trips are fine, but wrap up well.",
+    "• Cool – good for walks and light activity with a coat.",
+    "• Comfortable – great for most outdoor activities.",
+    "• Warm – good, but drink water and avoid pushing too hard.",
+    "• Hot – avoid intense activity in the middle of the day, seek shade.",
+)
+
+
+@per_forecast_text
 def generate_activities_text(forecast: Dict[str, Any], best_hour: Optional[str]) -> str:
     daily = forecast.get("daily") or {}
     current = forecast.get("current") or {}
@@ -2381,14 +3093,9 @@ def generate_activities_text(forecast: Dict[str, Any], best_hour: Optional[str])
     temp_c = current.get("temperature_2m")
     feels_c = current.get("apparent_temperature")
 
-    uvmax = daily.get("uv_index_max") or []
-    uv_today = uvmax[0] if uvmax else None
-
-    rain_prob_daily = daily.get("precipitation_probability_max") or []
-    rain_prob_today = rain_prob_daily[0] if rain_prob_daily else None
-
-    wind_daily = daily.get("wind_speed_10m_max") or []
-    wind_today = wind_daily[0] if wind_daily else None
+    uv_today, rain_prob_today, wind_today = (
+        _first(daily, k) for k in ("uv_index_max", "precipitation_probability_max", "wind_speed_10m_max")
+    )
 
     codes_daily = daily.get("weather_code") or []
     code_today = codes_daily[0] if codes_daily else current.get("weather_code")
@@ -2400,16 +3107,7 @@ def generate_activities_text(forecast: Dict[str, Any], best_hour: Optional[str])
     if base_temp is None:
         lines.append("• Temperature data missing – judge by how it feels.")
     else:
-        if base_temp <= 3:
-            lines.append("• Feels very cold – short outdoor trips are fine, but wrap up well.")
-        elif base_temp <= 10:
-            lines.append("• Cool – good for walks and light activity with a coat.")
-        elif base_temp <= 24:
-            lines.append("• Comfortable – great for most outdoor activities.")
-        elif base_temp <= 30:
-            lines.append("• Warm – good, but drink water and avoid pushing too hard.")
-        else:
-            lines.append("• Hot – avoid intense activity in the middle of the day, seek shade.")
+        lines.append(ACTIVITY_TEMP_LINES[bisect.bisect_left(ACTIVITY_TEMP_BANDS, base_temp)])
 
     if best_hour and "T" in best_hour:
         hhmm = best_hour.split("T")[1][:5]
@@ -2460,33 +3158,37 @@ def generate_activities_text(forecast: Dict[str, Any], best_hour: Optional[str])
 def update_day_selector(daily: Dict[str, Any]) -> None:
     global daily_dates, day_buttons, selected_day_index
     daily_dates = daily.get("time") or []
+    max_days = min(FORECAST_DAYS, len(daily_dates))
 
-    for b in day_buttons:
-        b.destroy()
-    day_buttons = []
+    # Buttons are created once per index and reused: a refresh relabels the
+    # ones it needs and unpacks the rest, so the packed ones stay a prefix.
+    for btn in _day_button_pool[max_days:]:
+        btn.pack_forget()
+    day_buttons = _day_button_pool[:max_days]
 
     if not daily_dates:
         return
 
     selected_day_index = 0
-    max_days = min(FORECAST_DAYS, len(daily_dates))
     for idx in range(max_days):
-        date_str = daily_dates[idx]
-        try:
-            dt = datetime.fromisoformat(date_str)
-            label = dt.strftime("%a")
-        except Exception:
-            label = f"D{idx+1}"
-        btn = tk.Button(
-            day_selector_frame,
-            text=label,
-            command=lambda i=idx: on_day_button_click(i),
-            width=6,
-            height=2,
-            font=("Arial", 11, "bold")
-        )
-        btn.pack(side="left", padx=2)
-        day_buttons.append(btn)
+        # weekday_label() caches "%a" per date string, shared with the chart.
+        label = weekday_label(daily_dates[idx]) if parse_iso(daily_dates[idx]) else f"D{idx+1}"
+        if idx < len(_day_button_pool):
+            btn = _day_button_pool[idx]
+            btn.config(text=label)
+        else:
+            btn = tk.Button(
+                day_selector_frame,
+                text=label,
+                command=lambda i=idx: on_day_button_click(i),
+                width=6,
+                height=2,
+                font=("Arial", 11, "bold")
+            )
+            _day_button_pool.append(btn)
+            day_buttons.append(btn)
+        if not btn.winfo_manager():
+            btn.pack(side="left", padx=2)
 
     apply_theme()
     style_day_buttons()
@@ -2505,16 +3207,18 @@ def on_day_button_click(idx: int) -> None:
 # SMART HEADER MICRO-SUMMARY (NEW)
 # ===========================
 
+# Same idea as ACTIVITY_TEMP_BANDS, for the one-word header summary.
+MICRO_TEMP_BANDS = (5, 12, 20, 27)
+MICRO_TEMP_LABELS = ("Very cold", "Chilly", "Cool", "Mild", "Warm")
+
+
+@functools.lru_cache(maxsize=64, typed=True)
 def build_micro_summary(temp_c, feels_c, rain_prob, wind_kmh, code, best_hour) -> str:
     parts = []
     base = feels_c if feels_c is not None else temp_c
 
     if isinstance(base, (int, float)):
-        if base <= 5: parts.append("Very cold")
-        elif base <= 12: parts.append("Chilly")
-        elif base <= 20: parts.append("Cool")
-        elif base <= 27: parts.append("Mild")
-        else: parts.append("Warm")
+        parts.append(MICRO_TEMP_LABELS[bisect.bisect_left(MICRO_TEMP_BANDS, base)])
 
     if isinstance(wind_kmh, (int, float)) and wind_kmh >= 25:
         parts.append("breezy")
@@ -2535,17 +3239,41 @@ def build_micro_summary(temp_c, feels_c, rain_prob, wind_kmh, code, best_hour) -
 # RENDERING
 # ===========================
 
+# Header alerts, in display order: (value, accepted types, threshold, message).
+# The weather code only counts as an int, as Open-Meteo sends it.
+ALERT_RULES: Tuple[Tuple[str, Tuple[type, ...], float, str], ...] = (
+    ("rain_prob", (int, float), 80, "Heavy rain likely today."),
+    ("wind", (int, float), 60, "Very windy/gusty later today."),
+    ("code", (int,), 95, "Thunderstorms possible."),
+    ("uv", (int, float), 8, "Very strong UV around midday."),
+)
+
 def render_weather(loc: Dict[str, Any],
                    forecast: Dict[str, Any],
                    air: Optional[Dict[str, Any]]) -> None:
-    global last_forecast, last_location, last_air, weather_bg, best_hour_time
+    # Every panel update below resizes scrollable_frame; with the
+    # <Configure> handler attached that recomputes the scrollregion dozens
+    # of times. Detach it, let geometry settle in one idle pass, then set
+    # the scrollregion once.
+    scrollable_frame.unbind("<Configure>")
+    try:
+        _render_weather(loc, forecast, air)
+    finally:
+        content_canvas.update_idletasks()
+        scrollable_frame.bind("<Configure>", on_frame_configure)
+        on_frame_configure(None)
+
+
+def _render_weather(loc: Dict[str, Any],
+                    forecast: Dict[str, Any],
+                    air: Optional[Dict[str, Any]]) -> None:
+    global last_forecast, last_location, last_air, weather_bg, best_hour_time, _last_rendered_signature
     last_forecast = forecast
     last_location = loc
     last_air = air
 
     current = forecast.get("current") or {}
     daily = forecast.get("daily") or {}
-    hourly = forecast.get("hourly") or {}
 
     location_label.config(text="Location: " + format_location(loc))
 
@@ -2564,47 +3292,51 @@ def render_weather(loc: Dict[str, Any],
     icon_label.config(text=weather_icon(code))
     big_temp_label.config(text=fmt_temp_value(temp_c))
 
-    tmax = daily.get("temperature_2m_max") or []
-    tmin = daily.get("temperature_2m_min") or []
-    hi = fmt_temp_value(tmax[0]) if tmax else "N/A"
-    lo = fmt_temp_value(tmin[0]) if tmin else "N/A"
+    disp = display_arrays(forecast)
+    tmax = disp["daily_tmax"]
+    tmin = disp["daily_tmin"]
+    hi = fmt_display_temp(tmax[0]) if tmax else "N/A"
+    lo = fmt_display_temp(tmin[0]) if tmin else "N/A"
     hi_lo_label.config(text=f"Today: High {hi}   •   Low {lo}")
 
-    h_times = hourly.get("time") or []
-    h_hum = hourly.get("relative_humidity_2m") or []
+    # Today's humidity average over just today's slice of the view column.
+    view = forecast_view(forecast)
     day_str = now_time.split("T")[0] if isinstance(now_time, str) else None
-    hum_values = [
-        h for t, h in zip(h_times, h_hum)
-        if isinstance(t, str) and day_str and t.startswith(day_str) and isinstance(h, (int, float))
-    ]
+    hum_values: List[float] = []
+    if day_str:
+        start, end = day_slice(forecast, day_str)
+        h_times = view["hourly_times"]
+        hum_values = [
+            h for t, h in zip(h_times[start:end], view["h_hum"][start:end])
+            if h is not None and isinstance(t, str) and t.startswith(day_str)
+        ]
     hum_avg_today = sum(hum_values) / len(hum_values) if hum_values else hum
 
-    lines: List[str] = []
-    if now_time:
-        lines.append(f"Local time: {now_time}")
-    lines.append(f"Condition: {weather_text(code)}")
-    lines.append("")
-    lines.append(f"Temperature: {fmt_temp_value(temp_c)}")
-    lines.append(f"Feels like:  {fmt_temp_value(feels_c)}")
-    lines.append(f"Humidity:    {hum:.0f} %" if isinstance(hum, (int, float)) else "Humidity:    N/A")
-    if isinstance(press, (int, float)):
-        lines.append(f"Pressure:    {press:.0f} hPa")
-    else:
-        lines.append("Pressure:    N/A")
-    if isinstance(wind_spd, (int, float)):
-        wd = f"{wind_dir:.0f}°" if isinstance(wind_dir, (int, float)) else "?"
-        lines.append(f"Wind:        {fmt_wind_value(wind_spd)} (dir {wd})")
+    # Current conditions as one formatted block; each optional value is
+    # resolved to its text first.
+    num = (int, float)
+    hum_s = f"{hum:.0f} %" if isinstance(hum, num) else "N/A"
+    press_s = f"{press:.0f} hPa" if isinstance(press, num) else "N/A"
+    if isinstance(wind_spd, num):
+        wd = f"{wind_dir:.0f}°" if isinstance(wind_dir, num) else "?"
+        wind_s = f"{fmt_wind_value(wind_spd)} (dir {wd})"
     else:
-        lines.append("Wind:        N/A")
-    if isinstance(precip, (int, float)):
-        lines.append(f"Precip now:  {fmt_rain_value(precip)}")
-    if isinstance(rain, (int, float)):
-        lines.append(f"Rain now:    {fmt_rain_value(rain)}")
-
-    set_text(current_text, "\n".join(lines))
+        wind_s = "N/A"
+    set_text(current_text, (
+        (f"Local time: {now_time}\n" if now_time else "")
+        + f"Condition: {weather_text(code)}\n"
+        f"\n"
+        f"Temperature: {fmt_temp_value(temp_c)}\n"
+        f"Feels like:  {fmt_temp_value(feels_c)}\n"
+        f"Humidity:    {hum_s}\n"
+        f"Pressure:    {press_s}\n"
+        f"Wind:        {wind_s}"
+        + (f"\nPrecip now:  {fmt_rain_value(precip)}" if isinstance(precip, num) else "")
+        + (f"\nRain now:    {fmt_rain_value(rain)}" if isinstance(rain, num) else "")
+    ))
 
     set_text(forecast_text, build_daily_text(forecast))
-    draw_12day_chart(daily)
+    draw_12day_chart(forecast)
 
     overview = generate_12day_overview(forecast)
     set_text(ten_day_overview_text, overview)
@@ -2616,14 +3348,14 @@ def render_weather(loc: Dict[str, Any],
     best_hour_time = best
     draw_hourly_strip(forecast)
 
-    draw_air_card(air)
+    # Optional panels the settings hide are not drawn; turning one back on
+    # re-renders (see open_settings), which fills it in.
+    if show_air_panel:
+        draw_air_card(air)
 
-    uv_daily = daily.get("uv_index_max") or []
-    uv_today = uv_daily[0] if uv_daily else None
-    rain_prob_daily = daily.get("precipitation_probability_max") or []
-    rain_prob_today = rain_prob_daily[0] if rain_prob_daily else None
-    wind_daily = daily.get("wind_speed_10m_max") or []
-    wind_today = wind_daily[0] if wind_daily else None
+    uv_today, rain_prob_today, wind_today = (
+        _first(daily, k) for k in ("uv_index_max", "precipitation_probability_max", "wind_speed_10m_max")
+    )
 
     if air:
         eu_aqi = air.get("european_aqi")
@@ -2646,11 +3378,13 @@ def render_weather(loc: Dict[str, Any],
     )
     set_text(suggestions_text, suggestions)
 
-    activities_str = generate_activities_text(forecast, best_hour_time)
-    set_text(activities_text, activities_str)
+    if show_activities_panel:
+        activities_str = generate_activities_text(forecast, best_hour_time)
+        set_text(activities_text, activities_str)
 
-    story_str = generate_story_text(forecast)
-    set_text(story_text, story_str)
+    if show_story_panel:
+        story_str = generate_story_text(forecast)
+        set_text(story_text, story_str)
 
     draw_sunrise_card(forecast)
     draw_wind_card(forecast)
@@ -2668,82 +3402,130 @@ def render_weather(loc: Dict[str, Any],
     )
 
     # Alerts + NEW banner styling
-    alert_messages: List[str] = []
-    if isinstance(rain_prob_today, (int, float)) and rain_prob_today >= 80:
-        alert_messages.append("Heavy rain likely today.")
-    if isinstance(wind_today, (int, float)) and wind_today >= 60:
-        alert_messages.append("Very windy/gusty later today.")
-    if isinstance(code, int) and code >= 95:
-        alert_messages.append("Thunderstorms possible.")
-    if isinstance(uv_today, (int, float)) and uv_today >= 8:
-        alert_messages.append("Very strong UV around midday.")
+    alert_values = {"rain_prob": rain_prob_today, "wind": wind_today, "code": code, "uv": uv_today}
+    alert_messages = [
+        message for key, kinds, threshold, message in ALERT_RULES
+        if isinstance(alert_values[key], kinds) and alert_values[key] >= threshold
+    ]
 
+    # Text and colours go to Tk in one configure call per branch.
     if alert_messages:
-        alert_label.config(text=" ⚠️ " + " ".join(alert_messages))
         # soft coloured pill
         if theme_mode == "light":
-            alert_label.config(bg="#fee2e2", fg="#991b1b")
+            pill_bg, pill_fg = "#fee2e2", "#991b1b"
         else:
-            alert_label.config(bg="#7f1d1d", fg="#fee2e2")
+            pill_bg, pill_fg = "#7f1d1d", "#fee2e2"
+        alert_label.config(text=" ⚠️ " + " ".join(alert_messages), bg=pill_bg, fg=pill_fg)
     else:
-        alert_label.config(text="")
         # reset bg to card
         theme = THEMES[theme_mode]
-        alert_label.config(bg=theme["card_bg"], fg=theme["fg"])
+        alert_label.config(text="", bg=theme["card_bg"], fg=theme["fg"])
 
     now_local = datetime.now().strftime("%H:%M")
     last_updated_label.config(text=f"Last updated: {now_local}")
 
     save_settings()
+    _last_rendered_signature = render_signature()
 
 
 # ===========================
 # BUTTON HANDLER
 # ===========================
 
+_weather_loading = False
+
+
+def set_weather_loading(loading: bool) -> None:
+    global _weather_loading
+    _weather_loading = loading
+    if loading:
+        get_button.config(text="Loading...", state="disabled")
+        root.update_idletasks()
+    else:
+        get_button.config(text="Get Weather", state="normal")
+
+
+def fetch_and_render(loc: Dict[str, Any], fill_entry: bool) -> None:
+    """Fetch forecast + air for an already-geocoded location, then render it."""
+    def on_data(data) -> None:
+        set_weather_loading(False)
+        forecast, air = data or (None, None)
+        if not forecast:
+            return
+        if fill_entry:
+            city_entry.delete(0, tk.END)
+            city_entry.insert(0, format_location(loc))
+        render_weather(loc, forecast, air)
+
+    run_in_background(lambda: fetch_forecast_and_air(loc), on_data)
+
+
+def load_location(loc: Dict[str, Any]) -> None:
+    """
+    Load a location that already has coordinates (favourite, last location),
+    skipping the geocoding round-trip.
+    """
+    if _weather_loading:
+        return
+    set_weather_loading(True)
+    fetch_and_render(loc, fill_entry=True)
+
+
 def on_get_weather(event=None) -> None:
     city = city_entry.get().strip()
     if not city:
         messagebox.showwarning("City name", "Please type a city or area, e.g. 'Barnes, London'.")
         return
+    if _weather_loading:
+        return
 
-    get_button.config(text="Loading...", state="disabled")
-    root.update_idletasks()
-    try:
-        loc = geocode_city(city)
-        if not loc:
+    set_weather_loading(True)
+
+    def on_results(results: Optional[List[Dict[str, Any]]]) -> None:
+        if results is None:
+            set_weather_loading(False)
             return
-        forecast = fetch_weather_cached(loc["latitude"], loc["longitude"], loc["timezone"])
-        if not forecast:
+        geocode_city(city, results, on_location)
+
+    def on_location(loc: Optional[Dict[str, Any]]) -> None:
+        if not loc:
+            set_weather_loading(False)
             return
-        air = fetch_air_quality(loc["latitude"], loc["longitude"], loc["timezone"])
-        render_weather(loc, forecast, air)
-    finally:
-        get_button.config(text="Get Weather", state="normal")
+        fetch_and_render(loc, fill_entry=False)
+
+    run_in_background(lambda: geocode_search(city), on_results)
 
 
 # ===========================
 # AUTOCOMPLETE (NEW)
 # ===========================
 
+AUTOCOMPLETE_DELAY_MS = 250
+
 _autocomplete_results: List[Dict[str, Any]] = []
+_autocomplete_labels: List[str] = []  # rows currently in autocomplete_listbox
 _autocomplete_after_id = None
+# Bumped per lookup so a slow response for an older query is dropped.
+_autocomplete_request = 0
 
 def show_autocomplete(results: List[Dict[str, Any]]) -> None:
-    global _autocomplete_results
+    global _autocomplete_results, _autocomplete_labels
     _autocomplete_results = results
 
-    autocomplete_listbox.delete(0, tk.END)
-    for r in results:
-        name = r.get("name") or ""
-        admin1 = r.get("admin1") or ""
-        country = r.get("country") or ""
-        parts = [name]
-        if admin1:
-            parts.append(admin1)
-        if country:
-            parts.append(country)
-        autocomplete_listbox.insert(tk.END, ", ".join(parts))
+    # Rows shared with the previous list (typing one more letter often keeps
+    # the top matches) stay; only the differing tail is replaced, in one
+    # delete and one insert call.
+    labels = [format_location(r) for r in results]
+    keep = 0
+    for old, new in zip(_autocomplete_labels, labels):
+        if old != new:
+            break
+        keep += 1
+    if keep < len(_autocomplete_labels):
+        autocomplete_listbox.delete(keep, tk.END)
+    if keep < len(labels):
+        autocomplete_listbox.insert(tk.END, *labels[keep:])
+    _autocomplete_labels = labels
 
     if results:
         autocomplete_listbox.place(x=8, y=35, width=360, height=min(120, 20*len(results)))
@@ -2753,6 +3535,9 @@ def show_autocomplete(results: List[Dict[str, Any]]) -> None:
 
 
 def hide_autocomplete(event=None) -> None:
+    # Also drop any lookup still in flight, so it cannot reopen the list.
+    global _autocomplete_request
+    _autocomplete_request += 1
     autocomplete_listbox.place_forget()
 
 
@@ -2774,20 +3559,45 @@ def on_autocomplete_pick(event=None) -> None:
 
 
 def schedule_autocomplete(event=None):
+    # Debounce: each keystroke cancels the pending lookup, so only the
+    # last one in a burst of typing hits the network.
     global _autocomplete_after_id
     if _autocomplete_after_id:
         root.after_cancel(_autocomplete_after_id)
-    _autocomplete_after_id = root.after(350, run_autocomplete)
+    _autocomplete_after_id = root.after(AUTOCOMPLETE_DELAY_MS, run_autocomplete)
+
+
+@functools.lru_cache(maxsize=256)
+def autocomplete_matches(text: str) -> Tuple[Dict[str, Any], ...]:
+    """Geocode matches per query, memoized. Raises LookupError (not cached) on network failure."""
+    results = geocode_search(text)
+    if results is None:
+        raise LookupError(text)
+    return tuple(results)
 
 
 def run_autocomplete():
+    global _autocomplete_after_id, _autocomplete_request
+    _autocomplete_after_id = None
+    _autocomplete_request += 1
+    request = _autocomplete_request
     text = city_entry.get().strip()
     if len(text) < 2:
         show_autocomplete([])
         return
-    data = http_get_json(GEOCODE_URL, {"name": text, "count": 5, "language": "en", "format": "json"})
-    results = (data or {}).get("results") or []
-    show_autocomplete(results)
+
+    # The lookup runs off the Tk thread so typing never waits on the network.
+    def work() -> List[Dict[str, Any]]:
+        try:
+            return list(autocomplete_matches(text))
+        except LookupError:
+            return []
+
+    def done(results: Optional[List[Dict[str, Any]]]) -> None:
+        if request == _autocomplete_request:
+            show_autocomplete(results or [])
+
+    run_in_background(work, done)
 
 
 # ===========================
@@ -2803,7 +3613,9 @@ root.option_add("*Font", "Arial 11")
 top_frame = tk.Frame(root, padx=10, pady=8)
 top_frame.pack(fill="x")
 
-tk.Label(top_frame, text="City / area:").pack(side="left")
+city_label = tk.Label(top_frame, text="City / area:")
+city_label.pack(side="left")
+top_labels.append(city_label)
 city_entry = tk.Entry(top_frame, width=32)
 city_entry.pack(side="left", padx=5)
 city_entry.bind("<Return>", on_get_weather)
@@ -2821,6 +3633,7 @@ theme_button.pack(side="right")
 
 settings_button = tk.Button(top_frame, text="⚙ Settings", command=open_settings)
 settings_button.pack(side="right", padx=5)
+top_buttons.extend((units_button, theme_button, settings_button))
 
 # Autocomplete listbox (NEW)
 autocomplete_listbox = tk.Listbox(top_frame)
@@ -2839,7 +3652,9 @@ favourites_frame = tk.Frame(middle_frame, padx=8, pady=8, width=230)
 favourites_frame.pack(side="left", fill="y")
 favourites_frame.pack_propagate(False)
 
-tk.Label(favourites_frame, text="Favourites", font=("Arial", 12, "bold")).pack(anchor="w")
+favourites_title = tk.Label(favourites_frame, text="Favourites", font=("Arial", 12, "bold"))
+favourites_title.pack(anchor="w")
+favourites_labels.append(favourites_title)
 
 favourites_listbox = tk.Listbox(favourites_frame, height=18, selectmode=tk.EXTENDED)
 favourites_listbox.pack(side="left", fill="both", expand=True, pady=5)
@@ -3089,10 +3904,11 @@ footer_label.pack(side="bottom", pady=5)
 
 # Load settings & start
 load_settings()
+load_forecast_cache()
 units_button.config(text=f"Units: {'Metric' if units_mode == 'metric' else 'Imperial'}")
 
-for loc in favourites:
-    favourites_listbox.insert(tk.END, format_location(loc))
+if favourites:
+    favourites_listbox.insert(tk.END, *[format_location(loc) for loc in favourites])
 
 load_wallpapers()
 apply_theme()
@@ -3102,3 +3918,11 @@ auto_load_last_location()
 
 if __name__ == "__main__":
     root.mainloop()
+    if _settings_save_id is not None:
+        flush_settings()
+    # The final save below supersedes any pending debounced one.
+    with _forecast_cache_lock:
+        if _forecast_cache_timer is not None:
+            _forecast_cache_timer.cancel()
+            _forecast_cache_timer = None
+    save_forecast_cache()